@@ -1,4 +1,16 @@
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
+from app.core.change_stream import change_watcher
+from app.core.database import ping_database
+from app.core.pool_monitor import pool_stats
+from app.core.dependencies import token_cache_stats
+from app.core.response_cache import response_cache
+from app.core.security import password_hasher_stats
+from app.core.singleflight import SingleFlight
+from app.services.author_service import AuthorService
+from app.services.category_service import CategoryService
+from app.services.user_service import UserService
+from app.services.view_service import view_counter
 
 router = APIRouter()
 
@@ -15,9 +27,20 @@ async def health_check():
 @router.get("/readiness", tags=["Health"])
 async def readiness_check():
     """Readiness probe for Kubernetes"""
-    # Add database connectivity check here if needed
+    if not await ping_database():
+        return ORJSONResponse(
+            status_code=503,
+            content={
+                "status": "not ready",
+                "database": "unreachable",
+                "pool": pool_stats.stats()
+            }
+        )
+    
     return {
-        "status": "ready"
+        "status": "ready",
+        "database": "ok",
+        "pool": pool_stats.stats()
     }
 
 
@@ -27,3 +50,34 @@ async def liveness_check():
     return {
         "status": "alive"
     }
+
+
+@router.get("/cache/stats", tags=["Health"])
+async def cache_stats():
+    """Cache hit/miss counters and change stream state for this replica"""
+    return {
+        "categories": CategoryService.cache_stats(),
+        "authors": AuthorService.cache_stats(),
+        "users": UserService.cache_stats(),
+        "tokens": token_cache_stats(),
+        "responses": response_cache.stats(),
+        "change_stream": change_watcher.stats()
+    }
+
+
+@router.get("/password-hashing/stats", tags=["Health"])
+async def password_hashing_stats():
+    """Password hashing pool queue depth for this replica"""
+    return password_hasher_stats()
+
+
+@router.get("/coalescing/stats", tags=["Health"])
+async def coalescing_stats():
+    """Single-flight read coalescing counters for this replica"""
+    return {group.name: group.stats() for group in SingleFlight.instances}
+
+
+@router.get("/views/stats", tags=["Health"])
+async def view_counter_stats():
+    """Buffered view counter state for this worker"""
+    return view_counter.stats()
@@ -1,41 +1,255 @@
-from fastapi import APIRouter, HTTPException, status, Query
-from typing import List, Optional
+import csv
+import io
+import orjson
+from datetime import datetime
+from fastapi import APIRouter, HTTPException, status, Query, Body, Request, Response
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, List, Optional, Set, Tuple, Union
+from app.core.config import settings
+from app.core.http_cache import conditional_get
+from app.core.profiling import TimedORJSONResponse
 from app.schemas.content_schema import (
     ContentSchema,
+    ContentPartialSchema,
+    TrendingContentSchema,
+    TrendingContentPartialSchema,
+    ContentBatchGetSchema,
+    ContentBatchResultSchema,
     ContentCreateSchema,
     ContentUpdateSchema,
+    BulkResultSchema,
     CategorySchema,
     CategoryCreateSchema,
     AuthorSchema,
     AuthorCreateSchema
 )
-from app.services.content_service import ContentService
+from app.services.content_service import (
+    EXPANSIONS,
+    ContentService,
+    export_keys,
+    parse_expand,
+    parse_fields
+)
+from app.services.author_service import AuthorService
 from app.services.category_service import CategoryService
+from app.services.view_service import view_counter
 
 router = APIRouter()
 
 
 # Content routes
-@router.get("/content", response_model=List[ContentSchema], tags=["Content"])
+FIELDS_DESCRIPTION = "Comma-separated fields to return, e.g. title,image_url,tags (id is always included)"
+EXPAND_DESCRIPTION = "Comma-separated references to embed: author, category"
+TAG_DESCRIPTION = "Exact tag to filter by; repeat for several tags"
+TAG_MODE_DESCRIPTION = "any: items with at least one of the tags, all: items with every tag"
+
+
+def _parse_fields_or_400(fields: Optional[str]) -> Optional[List[str]]:
+    """Validate the fields parameter, rejecting unknown fields"""
+    try:
+        return parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _parse_read_params(fields: Optional[str], expand: Optional[str]) -> Tuple[Optional[List[str]], Set[str]]:
+    """Validate fields and expand together, making sure a sparse fieldset
+    still fetches the reference keys the expansions need"""
+    selected = _parse_fields_or_400(fields)
+    try:
+        expansions = parse_expand(expand)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if selected is not None:
+        for name in sorted(expansions):
+            reference_key = EXPANSIONS[name][0]
+            if reference_key not in selected:
+                selected.append(reference_key)
+    return selected, expansions
+
+
+def _read_collections(expansions: Set[str]) -> List[str]:
+    """Collections whose changes affect a content read"""
+    return ["content_items"] + [EXPANSIONS[name][1] for name in sorted(expansions)]
+
+
+@router.get("/content", response_model=List[Union[ContentSchema, ContentPartialSchema]], tags=["Content"])
 async def get_content_items(
+    request: Request,
     category: Optional[str] = Query(None, description="Filter by category ID"),
-    search: Optional[str] = Query(None, description="Search in title and description"),
-    limit: int = Query(50, ge=1, le=100)
+    search: Optional[str] = Query(None, description="Search title, tags and description, ranked by relevance"),
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    created_after: Optional[datetime] = Query(None, description="Only items created at or after this time"),
+    created_before: Optional[datetime] = Query(None, description="Only items created before this time"),
+    expand: Optional[str] = Query(None, description=EXPAND_DESCRIPTION),
+    tag: Optional[List[str]] = Query(None, description=TAG_DESCRIPTION),
+    tag_mode: str = Query("any", pattern="^(any|all)$", description=TAG_MODE_DESCRIPTION)
+):
+    """Get content items with optional filtering, newest first.
+    
+    When more items are available the opaque cursor for the next page is
+    returned in the ``X-Next-Cursor`` response header. Items come back from
+    the service already shaped like ContentSchema, so they are serialized
+    directly instead of being re-validated against the response model.
+    """
+    selected, expansions = _parse_read_params(fields, expand)
+    validators, not_modified = await conditional_get(
+        request, _read_collections(expansions), settings.content_cache_control
+    )
+    if not_modified:
+        return not_modified
+    
+    try:
+        items, next_cursor = await ContentService.get_all_content(
+            category, search, limit, cursor, selected, created_after, created_before, tag, tag_mode
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    items = await ContentService.expand_references(items, expansions)
+    
+    headers = dict(validators)
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    return TimedORJSONResponse(items, headers=headers)
+
+
+async def _ndjson_chunks(items: AsyncIterator[dict]) -> AsyncIterator[bytes]:
+    """Encode items as NDJSON, one chunk per export batch"""
+    lines = []
+    async for item in items:
+        lines.append(orjson.dumps(item))
+        if len(lines) >= settings.export_batch_size:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+def _csv_value(value):
+    """Flatten a content field into a CSV cell"""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return "|".join(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+async def _csv_chunks(items: AsyncIterator[dict], keys: List[str]) -> AsyncIterator[str]:
+    """Encode items as CSV with a header row, one chunk per export batch"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["id" if key == "_id" else key for key in keys])
+    rows = 0
+    async for item in items:
+        writer.writerow([_csv_value(item.get(key)) for key in keys])
+        rows += 1
+        if rows % settings.export_batch_size == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+    yield buffer.getvalue()
+
+
+@router.get("/content/export", tags=["Content"])
+async def export_content_items(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="ndjson or csv"),
+    category: Optional[str] = Query(None, description="Filter by category ID"),
+    created_after: Optional[datetime] = Query(None, description="Only items created at or after this time"),
+    created_before: Optional[datetime] = Query(None, description="Only items created before this time"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    tag: Optional[List[str]] = Query(None, description=TAG_DESCRIPTION),
+    tag_mode: str = Query("any", pattern="^(any|all)$", description=TAG_MODE_DESCRIPTION)
+):
+    """Stream the full content catalog as NDJSON or CSV in constant memory"""
+    selected = _parse_fields_or_400(fields)
+    items = ContentService.iter_content(category, created_after, created_before, selected, tag, tag_mode)
+    
+    if format == "csv":
+        keys = export_keys(selected)
+        body, media_type = _csv_chunks(items, keys), "text/csv"
+    else:
+        body, media_type = _ndjson_chunks(items), "application/x-ndjson"
+    
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="content.{format}"'}
+    )
+
+
+@router.get(
+    "/content/trending",
+    response_model=List[Union[TrendingContentSchema, TrendingContentPartialSchema]],
+    tags=["Content"]
+)
+async def get_trending_content_items(
+    sort: str = Query("trending", pattern="^(trending|views)$", description="trending: recent views weigh more, views: total views"),
+    limit: int = Query(20, ge=1, le=100),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    expand: Optional[str] = Query(None, description=EXPAND_DESCRIPTION)
 ):
-    """Get all content items with optional filtering"""
-    items = await ContentService.get_all_content(category, search, limit)
-    return items
+    """Get the most viewed content items, trending first.
+    
+    Each item includes its ``views`` count, which other content reads leave
+    out. View counts are buffered and written every few seconds, so rankings
+    lag slightly behind live traffic.
+    """
+    selected, expansions = _parse_read_params(fields, expand)
+    items = await ContentService.get_trending(sort, limit, selected)
+    items = await ContentService.expand_references(items, expansions)
+    return TimedORJSONResponse(items)
 
 
-@router.get("/content/{item_id}", response_model=Content Schema, tags=["Content"])
-async def get_content_item(item_id: str):
+@router.get("/content/{item_id}", response_model=Union[ContentSchema, ContentPartialSchema], tags=["Content"])
+async def get_content_item(
+    item_id: str,
+    request: Request,
+    response: Response,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    expand: Optional[str] = Query(None, description=EXPAND_DESCRIPTION)
+):
     """Get a single content item by ID"""
-    item = await ContentService.get_content_by_id(item_id)
+    selected, expansions = _parse_read_params(fields, expand)
+    validators, not_modified = await conditional_get(
+        request, _read_collections(expansions), settings.content_cache_control
+    )
+    if not_modified:
+        return not_modified
+    
+    item = await ContentService.get_content_by_id(item_id, selected)
     if not item:
         raise HTTPException(status_code=404, detail="Content item not found")
+    # Only views of items that exist are buffered and flushed
+    view_counter.record(item_id)
+    item = (await ContentService.expand_references([item], expansions))[0]
+    if selected is not None:
+        # Only the requested keys, without nulls for the omitted ones
+        return TimedORJSONResponse(item, headers=validators)
+    response.headers.update(validators)
     return item
 
 
+@router.get("/content/{item_id}/related", response_model=List[Union[ContentSchema, ContentPartialSchema]], tags=["Content"])
+async def get_related_content_items(
+    item_id: str,
+    limit: int = Query(10, ge=1, le=50),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    expand: Optional[str] = Query(None, description=EXPAND_DESCRIPTION)
+):
+    """Get the content items most related to an item by shared tags and category"""
+    selected, expansions = _parse_read_params(fields, expand)
+    items = await ContentService.get_related(item_id, limit, selected)
+    if items is None:
+        raise HTTPException(status_code=404, detail="Content item not found")
+    items = await ContentService.expand_references(items, expansions)
+    return TimedORJSONResponse(items)
+
+
 @router.post("/content", response_model=ContentSchema, status_code=status.HTTP_201_CREATED, tags=["Content"])
 async def create_content_item(content: ContentCreateSchema):
     """Create a new content item"""
@@ -43,6 +257,38 @@ async def create_content_item(content: ContentCreateSchema):
     return item
 
 
+@router.post("/content/bulk", response_model=BulkResultSchema, tags=["Content"])
+async def bulk_create_content_items(items: List[dict] = Body(...)):
+    """Create many content items at once, reporting the outcome per item"""
+    if len(items) > settings.bulk_max_items:
+        raise HTTPException(status_code=413, detail=f"At most {settings.bulk_max_items} items per request")
+    return await ContentService.bulk_create_content(items)
+
+
+@router.put("/content/bulk", response_model=BulkResultSchema, tags=["Content"])
+async def bulk_upsert_content_items(items: List[dict] = Body(...)):
+    """Create or update many content items keyed by _id, reporting the outcome per item"""
+    if len(items) > settings.bulk_max_items:
+        raise HTTPException(status_code=413, detail=f"At most {settings.bulk_max_items} items per request")
+    return await ContentService.bulk_upsert_content(items)
+
+
+@router.post("/content/batch-get", response_model=ContentBatchResultSchema, tags=["Content"])
+async def batch_get_content_items(
+    batch: ContentBatchGetSchema,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    expand: Optional[str] = Query(None, description=EXPAND_DESCRIPTION)
+):
+    """Get many content items by ID in request order, reporting missing and invalid IDs"""
+    if len(batch.ids) > settings.batch_get_max_ids:
+        raise HTTPException(status_code=413, detail=f"At most {settings.batch_get_max_ids} IDs per request")
+    
+    selected, expansions = _parse_read_params(fields, expand)
+    result = await ContentService.get_content_by_ids(batch.ids, selected)
+    result["items"] = await ContentService.expand_references(result["items"], expansions)
+    return TimedORJSONResponse(result)
+
+
 @router.put("/content/{item_id}", response_model=ContentSchema, tags=["Content"])
 async def update_content_item(item_id: str, content: ContentUpdateSchema):
     """Update a content item"""
@@ -63,18 +309,28 @@ async def delete_content_item(item_id: str):
 
 # Category routes
 @router.get("/categories", response_model=List[CategorySchema], tags=["Categories"])
-async def get_categories():
+async def get_categories(request: Request, response: Response):
     """Get all categories"""
+    validators, not_modified = await conditional_get(request, ["categories"], settings.category_cache_control)
+    if not_modified:
+        return not_modified
+    
     categories = await CategoryService.get_all_categories()
+    response.headers.update(validators)
     return categories
 
 
 @router.get("/categories/{category_id}", response_model=CategorySchema, tags=["Categories"])
-async def get_category(category_id: str):
+async def get_category(category_id: str, request: Request, response: Response):
     """Get a single category by ID"""
+    validators, not_modified = await conditional_get(request, ["categories"], settings.category_cache_control)
+    if not_modified:
+        return not_modified
+    
     category = await CategoryService.get_category_by_id(category_id)
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
+    response.headers.update(validators)
     return category
 
 
@@ -85,3 +341,40 @@ async def create_category(category: CategoryCreateSchema):
     if not created_category:
         raise HTTPException(status_code=400, detail="Category slug already exists")
     return created_category
+
+
+# Author routes
+@router.get("/authors", response_model=List[AuthorSchema], tags=["Authors"])
+async def get_authors(
+    request: Request,
+    response: Response,
+    limit: int = Query(100, ge=1, le=500)
+):
+    """Get all authors"""
+    validators, not_modified = await conditional_get(request, ["authors"], settings.author_cache_control)
+    if not_modified:
+        return not_modified
+    
+    authors = await AuthorService.get_all_authors(limit)
+    response.headers.update(validators)
+    return authors
+
+
+@router.get("/authors/{author_id}", response_model=AuthorSchema, tags=["Authors"])
+async def get_author(author_id: str, request: Request, response: Response):
+    """Get a single author by ID"""
+    validators, not_modified = await conditional_get(request, ["authors"], settings.author_cache_control)
+    if not_modified:
+        return not_modified
+    
+    author = await AuthorService.get_author_by_id(author_id)
+    if not author:
+        raise HTTPException(status_code=404, detail="Author not found")
+    response.headers.update(validators)
+    return author
+
+
+@router.post("/authors", response_model=AuthorSchema, status_code=status.HTTP_201_CREATED, tags=["Authors"])
+async def create_author(author: AuthorCreateSchema):
+    """Create a new author"""
+    return await AuthorService.create_author(author)
@@ -0,0 +1,15 @@
+from fastapi import APIRouter, Query
+from typing import List
+from app.schemas.content_schema import TagSuggestionSchema
+from app.services.tag_service import TagService
+
+router = APIRouter()
+
+
+@router.get("/tags/suggest", response_model=List[TagSuggestionSchema], tags=["Tags"])
+async def suggest_tags(
+    prefix: str = Query(..., min_length=1, max_length=100, description="Case-insensitive tag prefix"),
+    limit: int = Query(10, ge=1, le=50)
+):
+    """Autocomplete tag names by prefix, most used first"""
+    return await TagService.suggest(prefix.strip(), limit)
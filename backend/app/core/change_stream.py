@@ -0,0 +1,163 @@
+import asyncio
+import inspect
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Set
+from pymongo.errors import OperationFailure, PyMongoError
+from app.core.database import get_database
+
+logger = logging.getLogger(__name__)
+
+# Server error codes meaning change streams are unavailable on this deployment
+# (standalone mongod, or a storage engine without majority read concern)
+_UNSUPPORTED_CODES = {40573, 40415, 20}
+
+
+class ChangeStreamWatcher:
+    """Follow writes to selected collections through a MongoDB change stream.
+    
+    Every replica runs its own watcher, so writes made through any pod (or
+    directly in the database) reach all of them. Handlers receive no
+    arguments and are called once per change; they may be sync or async.
+    Whenever the stream is (re)opened every handler is called once, since
+    changes may have been missed while it was down.
+    
+    Document handlers instead receive each change event, for in-memory
+    indexes that apply writes one by one (see ``subscribe_documents``).
+    """
+    
+    def __init__(self):
+        self.active = False
+        self.supported = True
+        self.events = 0
+        self._handlers: Dict[str, List[Callable]] = {}
+        self._document_handlers: Dict[str, List[Callable]] = {}
+        self._document_fields: Set[str] = set()
+        self._ignored_fields: List[str] = []
+        self._task: Optional[asyncio.Task] = None
+    
+    def subscribe(self, collection: str, handler: Callable) -> None:
+        """Call ``handler`` whenever ``collection`` changes"""
+        self._handlers.setdefault(collection, []).append(handler)
+    
+    def subscribe_documents(self, collection: str, handler: Callable, fields: Iterable[str]) -> None:
+        """Call ``handler(event)`` for every change to ``collection``.
+        
+        ``event`` has the ``operationType``, the ``documentKey``, the names
+        of the ``updatedFields`` and ``removedFields`` for updates, and the
+        requested ``fields`` of the current document under ``fullDocument``
+        (looked up for updates; missing for deletes or documents deleted
+        since). ``handler(None)`` is called when the stream reopens without
+        a resume point, as changes may have been missed.
+        """
+        self._document_handlers.setdefault(collection, []).append(handler)
+        self._document_fields.update(fields)
+    
+    def ignore_updates_to(self, field: str) -> None:
+        """Skip updates that set ``field``, e.g. counters written in bulk
+        that do not affect cached reads"""
+        self._ignored_fields.append(field)
+    
+    async def start(self) -> None:
+        """Start watching in the background"""
+        if self._task is None and (self._handlers or self._document_handlers):
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Stop watching"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.active = False
+    
+    async def _notify(self, collections, event: Optional[dict] = None, plain: bool = True, documents: bool = True) -> None:
+        for collection in collections:
+            calls = [(handler, ()) for handler in self._handlers.get(collection, []) if plain]
+            calls += [(handler, (event,)) for handler in self._document_handlers.get(collection, []) if documents]
+            for handler, args in calls:
+                try:
+                    result = handler(*args)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception:
+                    logger.exception("Change stream handler for %s failed", collection)
+    
+    def _pipeline(self) -> list:
+        collections = set(self._handlers) | set(self._document_handlers)
+        match = {"ns.coll": {"$in": sorted(collections)}}
+        for field in self._ignored_fields:
+            match[f"updateDescription.updatedFields.{field}"] = {"$exists": False}
+        # Ship only the namespace, the changed field names and the document
+        # fields handlers asked for, never whole document bodies
+        project = {"ns": 1, "operationType": 1}
+        if self._document_handlers:
+            project.update({
+                "documentKey": 1,
+                "updatedFields": {"$map": {
+                    "input": {"$objectToArray": "$updateDescription.updatedFields"},
+                    "in": "$$this.k"
+                }},
+                "removedFields": "$updateDescription.removedFields",
+                **{f"fullDocument.{field}": 1 for field in sorted(self._document_fields)}
+            })
+        return [{"$match": match}, {"$project": project}]
+    
+    async def _run(self) -> None:
+        pipeline = self._pipeline()
+        # Updates only carry the document when it is looked up
+        options = {"full_document": "updateLookup"} if self._document_handlers else {}
+        collections = set(self._handlers) | set(self._document_handlers)
+        resume_token = None
+        opened = False
+        delay = 1.0
+        
+        while True:
+            try:
+                async with get_database().watch(pipeline, resume_after=resume_token, **options) as stream:
+                    self.active = True
+                    delay = 1.0
+                    await self._notify(self._handlers, documents=False)
+                    if opened and resume_token is None:
+                        await self._notify(self._document_handlers, plain=False)
+                    opened = True
+                    async for change in stream:
+                        self.events += 1
+                        if change["operationType"] == "invalidate":
+                            resume_token = None
+                            self.active = False
+                            await self._notify(collections)
+                            break
+                        resume_token = stream.resume_token
+                        await self._notify([change["ns"]["coll"]], change)
+            except asyncio.CancelledError:
+                raise
+            except OperationFailure as e:
+                self.active = False
+                if e.code in _UNSUPPORTED_CODES:
+                    self.supported = False
+                    logger.warning("Change streams are not supported by this MongoDB deployment: %s", e)
+                    return
+                # The resume point may have rolled off the oplog; start over
+                logger.warning("Change stream failed, restarting: %s", e)
+                resume_token = None
+            except PyMongoError as e:
+                self.active = False
+                logger.warning("Change stream interrupted, retrying in %.0fs: %s", delay, e)
+            
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
+    
+    def stats(self) -> dict:
+        """Watcher state and event counter"""
+        return {
+            "active": self.active,
+            "supported": self.supported,
+            "events": self.events,
+            "collections": sorted(set(self._handlers) | set(self._document_handlers))
+        }
+
+
+change_watcher = ChangeStreamWatcher()
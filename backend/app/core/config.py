@@ -1,17 +1,39 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
     # MongoDB Configuration
     mongodb_url: str = "mongodb://localhost:27017"
     mongodb_db_name: str = "educated_guess"
+    mongodb_max_pool_size: int = 100
+    mongodb_min_pool_size: int = 10
+    mongodb_max_idle_time_ms: int = 300000
+    mongodb_connect_timeout_ms: int = 5000
+    mongodb_server_selection_timeout_ms: int = 5000
+    mongodb_wait_queue_timeout_ms: int = 2000
+    mongodb_compressors: str = ""
+    mongodb_app_name: Optional[str] = None
+    
+    # Observability Configuration
+    metrics_enabled: bool = True
+    server_timing_enabled: bool = True
+    server_timing_sample_rate: float = 1.0
+    query_budget_max_queries: int = 5
+    query_budget_max_ms: float = 500.0
+    
+    # Readiness Probe Configuration
+    readiness_timeout_seconds: float = 1.0
+    readiness_cache_seconds: float = 2.0
     
     # JWT Configuration
     secret_key: str = "your-secret-key-here-change-in-production-min-32-chars"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     
+    # Password Hashing Configuration (0 workers hashes inline on the event loop)
+    password_hash_workers: int = 2
+    
     # CORS Configuration
     allowed_origins: str = "http://localhost:3000,http://localhost:5173"
     
@@ -20,6 +42,60 @@ class Settings(BaseSettings):
     app_version: str = "1.0.0"
     api_v1_prefix: str = "/api/v1"
     
+    # Search Configuration
+    search_min_text_length: int = 3
+    
+    # Bulk Write Configuration
+    bulk_max_items: int = 10000
+    bulk_write_chunk_size: int = 1000
+    
+    # HTTP Caching Configuration
+    content_cache_control: str = "no-cache"
+    category_cache_control: str = "public, max-age=60"
+    author_cache_control: str = "public, max-age=60"
+    etag_version_ttl_seconds: float = 1.0
+    
+    # Batch Read Configuration
+    batch_get_max_ids: int = 500
+    
+    # Export Configuration
+    export_batch_size: int = 1000
+    
+    # Cache Configuration
+    category_cache_ttl_seconds: float = 300.0
+    category_cache_max_entries: int = 512
+    author_cache_ttl_seconds: float = 300.0
+    author_cache_max_entries: int = 5000
+    user_cache_ttl_seconds: float = 60.0
+    user_cache_max_entries: int = 10000
+    token_cache_max_entries: int = 10000
+    
+    # Response Cache Configuration ("none", "memory" or "redis"). Results are
+    # only served while the MongoDB change stream watcher is running.
+    response_cache_backend: str = "memory"
+    response_cache_ttl_seconds: float = 300.0
+    response_cache_max_entries: int = 5000
+    redis_url: str = "redis://localhost:6379/0"
+    
+    # Tag Autocomplete Configuration
+    tag_index_ttl_seconds: float = 300.0
+    tag_index_min_rebuild_seconds: float = 30.0
+    
+    # View Counter Configuration
+    view_flush_interval_seconds: float = 5.0
+    view_buffer_max_items: int = 10000
+    trending_half_life_hours: float = 24.0
+    
+    # Related Content Configuration
+    related_index_ttl_seconds: float = 300.0
+    related_index_min_rebuild_seconds: float = 30.0
+    related_category_weight: float = 1.0
+    related_posting_limit: int = 2000
+    
+    # Index Management Configuration
+    ensure_indexes_on_startup: bool = True
+    query_plan_check_on_startup: bool = True
+    
     @property
     def cors_origins(self) -> List[str]:
         return [origin.strip() for origin in self.allowed_origins.split(",")]
@@ -1,15 +1,44 @@
+import asyncio
+import time
 from motor.motor_asyncio import AsyncIOMotorClient
 from app.core.config import settings
+from app.core.metrics import mongo_command_metrics
+from app.core.pool_monitor import pool_stats
+from app.core.profiling import query_timing_listener
 
 # MongoDB client instance
 client = None
 database = None
 
+# Last readiness ping as (monotonic timestamp, succeeded)
+_last_ping = (0.0, False)
+
+
+def _client_options() -> dict:
+    """Connection pool and timeout options for the Motor client"""
+    options = {
+        "maxPoolSize": settings.mongodb_max_pool_size,
+        "minPoolSize": settings.mongodb_min_pool_size,
+        "maxIdleTimeMS": settings.mongodb_max_idle_time_ms,
+        "connectTimeoutMS": settings.mongodb_connect_timeout_ms,
+        "serverSelectionTimeoutMS": settings.mongodb_server_selection_timeout_ms,
+        "waitQueueTimeoutMS": settings.mongodb_wait_queue_timeout_ms,
+        "appname": settings.mongodb_app_name or settings.app_name,
+        "event_listeners": [pool_stats],
+    }
+    if settings.metrics_enabled:
+        options["event_listeners"].append(mongo_command_metrics)
+    if settings.server_timing_enabled:
+        options["event_listeners"].append(query_timing_listener)
+    if settings.mongodb_compressors:
+        options["compressors"] = settings.mongodb_compressors
+    return options
+
 
 async def connect_to_mongo():
     """Connect to MongoDB on application startup"""
     global client, database
-    client = AsyncIOMotorClient(settings.mongodb_url)
+    client = AsyncIOMotorClient(settings.mongodb_url, **_client_options())
     database = client[settings.mongodb_db_name]
     
     # Test connection
@@ -19,6 +48,14 @@ async def connect_to_mongo():
     except Exception as e:
         print(f"✗ MongoDB connection failed: {e}")
         raise
+    
+    # Open minPoolSize connections up front so a freshly scaled-out pod does
+    # not pay connection setup on its first requests
+    if settings.mongodb_min_pool_size > 0:
+        await asyncio.gather(*(
+            client.admin.command('ping') for _ in range(settings.mongodb_min_pool_size)
+        ))
+        print(f"✓ Warmed MongoDB pool: {pool_stats.stats()['open_connections']} connections")
 
 
 async def close_mongo_connection():
@@ -32,3 +69,27 @@ async def close_mongo_connection():
 def get_database():
     """Get database instance"""
     return database
+
+
+async def ping_database() -> bool:
+    """Check that MongoDB answers within the readiness timeout.
+    
+    The result is cached for ``readiness_cache_seconds`` so frequent probes
+    do not add load to the pool.
+    """
+    global _last_ping
+    checked_at, ok = _last_ping
+    if time.monotonic() - checked_at < settings.readiness_cache_seconds:
+        return ok
+    
+    if client is None:
+        ok = False
+    else:
+        try:
+            await asyncio.wait_for(client.admin.command('ping'), timeout=settings.readiness_timeout_seconds)
+            ok = True
+        except Exception:
+            ok = False
+    
+    _last_ping = (time.monotonic(), ok)
+    return ok
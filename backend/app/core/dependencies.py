@@ -1,15 +1,51 @@
+import time
 from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthCredentials
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.profiling import timed
 from app.core.security import decode_access_token
-from app.core.database import get_database
+from app.services.user_service import UserService
 
 security = HTTPBearer()
 
+# Decoded JWT payloads keyed by the raw token, so repeated requests with the
+# same bearer token skip signature verification until the token expires
+_token_cache = TTLCache(ttl=settings.user_cache_ttl_seconds, maxsize=settings.token_cache_max_entries)
 
-async def get_current_user(credentials: HTTPAuthCredentials = Depends(security)):
-    """Dependency to get current authenticated user"""
-    token = credentials.credentials
+
+def _decode_token_cached(token: str):
+    """Decode a JWT, reusing the payload of a recently verified token"""
+    payload = _token_cache.get(token)
+    if payload is not None:
+        return payload
+    
     payload = decode_access_token(token)
+    if payload is not None:
+        ttl = settings.user_cache_ttl_seconds
+        exp = payload.get("exp")
+        if exp is not None:
+            ttl = min(ttl, exp - time.time())
+        if ttl > 0:
+            _token_cache.set(token, payload, ttl=ttl)
+    
+    return payload
+
+
+def token_cache_stats() -> dict:
+    """Get decoded token cache hit/miss counters"""
+    return _token_cache.stats()
+
+
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    """Dependency to get current authenticated user"""
+    with timed("auth"):
+        return await _authenticate(credentials.credentials)
+
+
+async def _authenticate(token: str):
+    """Resolve a bearer token to the active user, raising 401 otherwise"""
+    payload = _decode_token_cached(token)
     
     if payload is None:
         raise HTTPException(
@@ -26,8 +62,7 @@ async def get_current_user(credentials: HTTPAuthCredentials = Depends(security))
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    db = get_database()
-    user = await db.users.find_one({"email": email})
+    user = await UserService.get_active_user_by_email(email)
     
     if user is None:
         raise HTTPException(
@@ -0,0 +1,48 @@
+import hashlib
+from typing import Iterable, Optional, Tuple
+from fastapi import Request, Response
+from app.core.versioning import CollectionVersions
+
+
+def make_etag(*parts) -> str:
+    """Build a strong ETag from the parts that determine a representation"""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check an ETag against the request's If-None-Match header"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison function
+    candidates = (tag.strip() for tag in header.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+async def conditional_get(
+    request: Request,
+    collections: Iterable[str],
+    cache_control: str
+) -> Tuple[dict, Optional[Response]]:
+    """Resolve validators for a read backed by ``collections``.
+    
+    The ETag combines the path, the query parameters and each collection's
+    version token, so it changes whenever any write could change the body.
+    Returns the validator headers to attach to the response, and a ready
+    304 response when the client's copy is still current, in which case the
+    route should return it without querying the database.
+    """
+    versions = [await CollectionVersions.get(name) for name in collections]
+    etag = make_etag(
+        request.url.path,
+        sorted(request.query_params.multi_items()),
+        *versions
+    )
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    
+    if etag_matches(request, etag):
+        return headers, Response(status_code=304, headers=headers)
+    return headers, None
@@ -0,0 +1,79 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class IndexRefresher:
+    """Rebuild an in-memory index in the background.
+    
+    The index is built once at ``start``, then again whenever it is marked
+    stale (at most every ``min_interval`` seconds) and at least every ``ttl``
+    seconds. ``build`` should construct a new index and swap it in when
+    complete, so requests keep reading the previous one and never wait on a
+    rebuild.
+    """
+    
+    def __init__(self, name: str, build: Callable[[], Awaitable[None]], ttl: float, min_interval: float):
+        self.name = name
+        self.ttl = ttl
+        self.min_interval = min_interval
+        self.ready = False
+        self.building = False
+        self.builds = 0
+        self.failures = 0
+        self._build = build
+        self._stale = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+    
+    def mark_stale(self) -> None:
+        """Rebuild once ``min_interval`` has passed since the last build"""
+        self._stale.set()
+    
+    async def _run(self) -> None:
+        while True:
+            # Cleared before reading, so writes racing with the build mark it
+            # stale again instead of being lost
+            self._stale.clear()
+            self.building = True
+            try:
+                await self._build()
+                self.ready = True
+                self.builds += 1
+            except Exception:
+                self.failures += 1
+                self._stale.set()
+                logger.exception("Rebuilding the %s index failed", self.name)
+            finally:
+                self.building = False
+            
+            await asyncio.sleep(self.min_interval)
+            try:
+                await asyncio.wait_for(self._stale.wait(), max(self.ttl - self.min_interval, 0))
+            except asyncio.TimeoutError:
+                pass
+    
+    async def start(self) -> None:
+        """Start building in the background"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Stop rebuilding"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    def stats(self) -> dict:
+        """Build state and counters"""
+        return {
+            "ready": self.ready,
+            "building": self.building,
+            "builds": self.builds,
+            "failures": self.failures
+        }
@@ -0,0 +1,104 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import PyMongoError
+from app.core.database import get_database
+
+logger = logging.getLogger(__name__)
+
+# Every index the services rely on, by collection. database/init_db.py keeps
+# its own copy so it can run standalone; keep the two in sync.
+INDEXES: Dict[str, List[IndexModel]] = {
+    "content_items": [
+        IndexModel(
+            [("title", "text"), ("tags", "text"), ("description", "text")],
+            weights={"title": 10, "tags": 5, "description": 1},
+            name="content_text_search"
+        ),
+        IndexModel([("title", ASCENDING)]),
+        IndexModel([("category_id", ASCENDING)]),
+        IndexModel([("created_at", DESCENDING)]),
+        # Keyset pagination seeks on (created_at, _id), optionally within a category
+        IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([("category_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+        # Multikey index for exact tag filters, sorted newest first
+        IndexModel([("tags", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+        # Trending and most viewed feeds
+        IndexModel([("trending_score", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([("views", DESCENDING), ("_id", DESCENDING)]),
+    ],
+    "categories": [IndexModel([("slug", ASCENDING)], unique=True)],
+    "authors": [IndexModel([("name", ASCENDING)])],
+    "users": [IndexModel([("email", ASCENDING)], unique=True)],
+}
+
+
+async def _drop_stale_text_index(coll, indexes: List[IndexModel]) -> None:
+    """Drop a text index that differs from the registry's.
+    
+    A collection holds at most one text index, so an older one (such as the
+    unnamed title/description index earlier deployments created) would make
+    the registry's fail to build.
+    """
+    wanted = next((model.document for model in indexes if "text" in model.document["key"].values()), None)
+    if wanted is None:
+        return
+    for name, info in (await coll.index_information()).items():
+        if ("_fts", "text") not in info["key"]:
+            continue
+        if name != wanted["name"] or info.get("weights") != wanted.get("weights"):
+            logger.warning("Replacing text index %s on %s with %s", name, coll.name, wanted["name"])
+            await coll.drop_index(name)
+
+
+async def ensure_indexes(db=None) -> Dict[str, List[str]]:
+    """Create any missing registry indexes.
+    
+    Existing indexes with the same keys and options are left alone, so this
+    is safe to run on every startup and from several replicas at once. An
+    outdated text index is replaced. Each index is created on its own, so one
+    that cannot be built (e.g. duplicates blocking a unique index) is logged
+    and skipped without holding back the rest. Returns the index names
+    ensured per collection.
+    """
+    db = db if db is not None else get_database()
+    ensured = {}
+    for collection, indexes in INDEXES.items():
+        coll = db[collection]
+        ensured[collection] = []
+        try:
+            await _drop_stale_text_index(coll, indexes)
+        except PyMongoError as e:
+            logger.error("Could not replace the text index on %s: %s", collection, e)
+        for index in indexes:
+            try:
+                ensured[collection].extend(await coll.create_indexes([index]))
+            except PyMongoError as e:
+                logger.error("Could not ensure index %s on %s: %s", index.document["name"], collection, e)
+    return ensured
+
+
+_build_task: Optional[asyncio.Task] = None
+
+
+async def _build_and_check() -> None:
+    # Imported here, as the checker imports the services
+    from app.core.config import settings
+    from app.core.query_plans import log_query_plan_issues
+    
+    try:
+        ensured = await ensure_indexes()
+        logger.info("Ensured indexes on %s", ", ".join(sorted(ensured)))
+        if settings.query_plan_check_on_startup:
+            await log_query_plan_issues()
+    except Exception:
+        logger.exception("Background index build failed")
+
+
+def start_index_build() -> None:
+    """Ensure indexes (and check query plans) in the background, so startup
+    does not wait for index builds on large collections"""
+    global _build_task
+    if _build_task is None or _build_task.done():
+        _build_task = asyncio.create_task(_build_and_check())
@@ -0,0 +1,148 @@
+import time
+from prometheus_client import Counter, Gauge, Histogram, REGISTRY
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from pymongo import monitoring
+from app.core.pool_monitor import pool_stats
+from app.core.security import password_hasher_stats
+from app.core.singleflight import SingleFlight
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0)
+MONGO_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+SIZE_BUCKETS = (100, 1_000, 10_000, 50_000, 100_000, 500_000, 1_000_000, 10_000_000)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being served",
+    ["method"]
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "HTTP response body size by route template",
+    ["method", "route"],
+    buckets=SIZE_BUCKETS
+)
+MONGO_COMMAND_LATENCY = Histogram(
+    "mongodb_command_duration_seconds",
+    "MongoDB command latency by command and collection",
+    ["command", "collection"],
+    buckets=MONGO_BUCKETS
+)
+MONGO_COMMAND_FAILURES = Counter(
+    "mongodb_command_failures_total",
+    "Failed MongoDB commands by command and collection",
+    ["command", "collection"]
+)
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording per-route latency, size and concurrency.
+    
+    Routes are labelled by their path template (``/api/v1/content/{item_id}``)
+    rather than the raw path, keeping label cardinality bounded.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        method = scope["method"]
+        in_progress = REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        status_code = 500
+        body_size = 0
+        
+        async def send_wrapper(message):
+            nonlocal status_code, body_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                body_size += len(message.get("body", b""))
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_progress.dec()
+            # FastAPI records the matched route on the scope during routing
+            route = scope.get("route")
+            template = getattr(route, "path", "unmatched")
+            REQUEST_LATENCY.labels(method, template, str(status_code)).observe(time.perf_counter() - started)
+            RESPONSE_SIZE.labels(method, template).observe(body_size)
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """Record MongoDB command timings using the driver's own durations"""
+    
+    def __init__(self):
+        # Collection names keyed by (connection, request id); dict operations
+        # are atomic, so no lock is needed across driver threads
+        self._collections = {}
+    
+    def started(self, event):
+        target = event.command.get(event.command_name)
+        if not isinstance(target, str):
+            # e.g. getMore carries the cursor id and names the collection separately
+            target = event.command.get("collection", "")
+        self._collections[(event.connection_id, event.request_id)] = target if isinstance(target, str) else ""
+    
+    def succeeded(self, event):
+        collection = self._collections.pop((event.connection_id, event.request_id), "")
+        MONGO_COMMAND_LATENCY.labels(event.command_name, collection).observe(event.duration_micros / 1_000_000)
+    
+    def failed(self, event):
+        collection = self._collections.pop((event.connection_id, event.request_id), "")
+        MONGO_COMMAND_LATENCY.labels(event.command_name, collection).observe(event.duration_micros / 1_000_000)
+        MONGO_COMMAND_FAILURES.labels(event.command_name, collection).inc()
+
+
+class RuntimeStatsCollector:
+    """Expose pool, password hashing and single-flight counters, read at scrape time"""
+    
+    def collect(self):
+        pool = pool_stats.stats()
+        for key, help_text in (
+            ("open_connections", "Open MongoDB connections"),
+            ("in_use", "MongoDB connections checked out"),
+            ("waiting", "Operations waiting for a MongoDB connection"),
+        ):
+            yield GaugeMetricFamily(f"mongodb_pool_{key}", help_text, value=pool[key])
+        
+        hashing = password_hasher_stats()
+        yield GaugeMetricFamily(
+            "password_hash_queue_depth",
+            "Password hashing operations waiting for a worker",
+            value=hashing["queue_depth"]
+        )
+        yield GaugeMetricFamily(
+            "password_hash_running",
+            "Password hashing operations in progress",
+            value=hashing["running"]
+        )
+        
+        calls = CounterMetricFamily("singleflight_calls_total", "Reads through a single-flight group", labels=["group"])
+        coalesced = CounterMetricFamily(
+            "singleflight_coalesced_total",
+            "Reads served by joining an identical call already in flight",
+            labels=["group"]
+        )
+        for group in SingleFlight.instances:
+            stats = group.stats()
+            calls.add_metric([group.name], stats["calls"])
+            coalesced.add_metric([group.name], stats["coalesced"])
+        yield calls
+        yield coalesced
+
+
+mongo_command_metrics = MongoCommandMetrics()
+REGISTRY.register(RuntimeStatsCollector())
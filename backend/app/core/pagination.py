@@ -0,0 +1,48 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+from bson import ObjectId
+
+
+def encode_cursor(created_at: datetime, item_id: str) -> str:
+    """Encode a (created_at, _id) position into an opaque cursor string"""
+    payload = json.dumps(
+        {"t": created_at.isoformat(), "id": str(item_id)},
+        separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, ObjectId]:
+    """Decode an opaque cursor string, raising ValueError if it is malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        created_at = datetime.fromisoformat(payload["t"])
+        item_id = payload["id"]
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError("Invalid cursor") from e
+    
+    if not ObjectId.is_valid(item_id):
+        raise ValueError("Invalid cursor")
+    
+    return created_at, ObjectId(item_id)
+
+
+def keyset_filter(cursor: Optional[str]) -> dict:
+    """Build the filter selecting documents strictly after the cursor position.
+    
+    Documents are ordered by ``created_at`` descending with ``_id`` descending
+    as a tie-breaker, so the seek stays stable when items share a timestamp.
+    """
+    if not cursor:
+        return {}
+    
+    created_at, item_id = decode_cursor(cursor)
+    return {
+        "$or": [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "_id": {"$lt": item_id}}
+        ]
+    }
@@ -0,0 +1,126 @@
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+from fastapi.responses import ORJSONResponse
+from pymongo import monitoring
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RequestTimings:
+    """Time spent per phase while serving one request"""
+    
+    __slots__ = ("db_queries", "db_seconds", "auth_seconds", "serialize_seconds")
+    
+    def __init__(self):
+        self.db_queries = 0
+        self.db_seconds = 0.0
+        self.auth_seconds = 0.0
+        self.serialize_seconds = 0.0
+
+
+# Set per request by ServerTimingMiddleware. Motor runs driver calls with a
+# copy of the caller's context, so command listeners see the request's object.
+_request_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+@contextmanager
+def timed(phase: str):
+    """Add the duration of the block to the current request's ``phase``"""
+    timings = _request_timings.get()
+    if timings is None:
+        yield
+        return
+    
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        attribute = f"{phase}_seconds"
+        setattr(timings, attribute, getattr(timings, attribute) + time.perf_counter() - started)
+
+
+class QueryTimingListener(monitoring.CommandListener):
+    """Count MongoDB round trips and their duration for the current request"""
+    
+    def started(self, event):
+        pass
+    
+    def succeeded(self, event):
+        self._record(event)
+    
+    def failed(self, event):
+        self._record(event)
+    
+    @staticmethod
+    def _record(event):
+        timings = _request_timings.get()
+        if timings is not None:
+            timings.db_queries += 1
+            timings.db_seconds += event.duration_micros / 1_000_000
+
+
+class TimedORJSONResponse(ORJSONResponse):
+    """ORJSONResponse that reports its encoding time as the serialize phase"""
+    
+    def render(self, content) -> bytes:
+        with timed("serialize"):
+            return super().render(content)
+
+
+class ServerTimingMiddleware:
+    """Pure ASGI middleware emitting a Server-Timing header per request.
+    
+    Reports database round trips (count and time), auth and serialization,
+    and logs requests over the configured query or latency budget. Only a
+    ``server_timing_sample_rate`` fraction of requests is profiled.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or random.random() >= settings.server_timing_sample_rate:
+            await self.app(scope, receive, send)
+            return
+        
+        timings = RequestTimings()
+        token = _request_timings.set(timings)
+        started = time.perf_counter()
+        status_code = 500
+        
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                total = time.perf_counter() - started
+                header = (
+                    f'db;dur={timings.db_seconds * 1000:.2f};desc="{timings.db_queries} queries", '
+                    f"auth;dur={timings.auth_seconds * 1000:.2f}, "
+                    f"serialize;dur={timings.serialize_seconds * 1000:.2f}, "
+                    f"total;dur={total * 1000:.2f}"
+                )
+                message["headers"] = list(message.get("headers", [])) + [(b"server-timing", header.encode())]
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_timings.reset(token)
+            total_ms = (time.perf_counter() - started) * 1000
+            if (
+                timings.db_queries > settings.query_budget_max_queries
+                or total_ms > settings.query_budget_max_ms
+            ):
+                logger.warning(
+                    "Request over budget: %s %s status=%s queries=%d db_ms=%.1f total_ms=%.1f",
+                    scope["method"], scope["path"], status_code,
+                    timings.db_queries, timings.db_seconds * 1000, total_ms
+                )
+
+
+query_timing_listener = QueryTimingListener()
@@ -0,0 +1,153 @@
+"""Check that the canonical service queries are served by indexes.
+
+Runs ``explain`` on each query the services issue on hot paths and reports
+any winning plan that scans a whole collection (COLLSCAN) or sorts in
+memory (SORT). Run it against a database with the registry indexes, e.g.
+in CI:
+    
+    python -m app.core.query_plans --ensure-indexes
+
+It exits with status 1 when any plan is flagged. The app also logs the
+same report at startup unless ``query_plan_check_on_startup`` is off.
+"""
+import argparse
+import asyncio
+import logging
+import sys
+from datetime import datetime
+from typing import List, NamedTuple, Optional
+from bson import ObjectId
+from pymongo.errors import OperationFailure
+from app.core.database import get_database
+from app.core.pagination import encode_cursor
+from app.services.content_service import list_query, text_search_query, title_prefix_query, trending_query
+
+logger = logging.getLogger(__name__)
+
+_SAMPLE_ID = ObjectId()
+_SAMPLE_TIME = datetime(2024, 1, 1)
+_SAMPLE_TAGS = ["design", "culture"]
+
+
+class CanonicalQuery(NamedTuple):
+    name: str
+    collection: str
+    filter: dict
+    sort: Optional[list] = None
+    limit: int = 50
+    # Why an in-memory sort is expected for this query, if it is
+    allow_sort: Optional[str] = None
+
+
+def _content(name: str, built: tuple, limit: int = 50, allow_sort: Optional[str] = None) -> CanonicalQuery:
+    """A content_items query from one of the content service's query builders"""
+    query, sort = built
+    return CanonicalQuery(name, "content_items", query, sort, limit, allow_sort)
+
+
+CANONICAL_QUERIES = [
+    _content("content list", list_query()),
+    _content("content list, next page", list_query(cursor=encode_cursor(_SAMPLE_TIME, str(_SAMPLE_ID)))),
+    _content("content list by category", list_query(category=str(_SAMPLE_ID))),
+    _content("content list by date range", list_query(created_after=_SAMPLE_TIME, created_before=datetime(2025, 1, 1))),
+    _content("content list by any tag", list_query(tags=_SAMPLE_TAGS, tag_mode="any")),
+    _content("content list by all tags", list_query(tags=_SAMPLE_TAGS, tag_mode="all")),
+    _content(
+        "content search", text_search_query("design"),
+        allow_sort="relevance ranking always sorts the text matches"
+    ),
+    _content(
+        "content title prefix search", title_prefix_query("De"),
+        allow_sort="top-k sort over the prefix matches found through the title index"
+    ),
+    _content("trending content", trending_query("trending"), 20),
+    _content("most viewed content", trending_query("views"), 20),
+    CanonicalQuery("category by slug", "categories", {"slug": "design"}, limit=1),
+    CanonicalQuery("author list", "authors", {}, [("name", 1)], 100),
+    CanonicalQuery("user by email", "users", {"email": "reader@example.com"}, limit=1),
+]
+
+
+def _plan_stages(plan) -> List[str]:
+    """Every stage name in an explain plan tree"""
+    stages = []
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.append(plan["stage"])
+        for key, value in plan.items():
+            # The slot-based engine's plan restates the query plan in its own terms
+            if key != "slotBasedPlan":
+                stages.extend(_plan_stages(value))
+    elif isinstance(plan, list):
+        for value in plan:
+            stages.extend(_plan_stages(value))
+    return stages
+
+
+async def explain_stages(query: CanonicalQuery, db=None) -> List[str]:
+    """Stage names of the winning plan for a canonical query"""
+    db = db if db is not None else get_database()
+    find = {"find": query.collection, "filter": query.filter, "limit": query.limit}
+    if query.sort:
+        find["sort"] = dict(query.sort)
+    result = await db.command({"explain": find, "verbosity": "queryPlanner"})
+    return _plan_stages(result["queryPlanner"]["winningPlan"])
+
+
+async def check_query_plans(db=None) -> List[str]:
+    """Explain every canonical query, returning one message per problem"""
+    issues = []
+    for query in CANONICAL_QUERIES:
+        try:
+            stages = await explain_stages(query, db)
+        except OperationFailure as e:
+            # e.g. a $text query without its text index
+            issues.append(f"{query.name}: explain failed: {e}")
+            continue
+        if "EOF" in stages:
+            issues.append(f"{query.name}: collection {query.collection} does not exist")
+        if "COLLSCAN" in stages:
+            issues.append(f"{query.name}: collection scan on {query.collection}")
+        if "SORT" in stages and not query.allow_sort:
+            issues.append(f"{query.name}: in-memory sort on {query.collection}")
+    return issues
+
+
+async def log_query_plan_issues() -> None:
+    """Log any canonical query that is not served by an index"""
+    try:
+        issues = await check_query_plans()
+    except Exception as e:
+        logger.warning("Query plan check failed: %s", e)
+        return
+    for issue in issues:
+        logger.warning("Unindexed query plan: %s", issue)
+    if not issues:
+        logger.info("All %d canonical queries use indexes", len(CANONICAL_QUERIES))
+
+
+async def _main(ensure: bool) -> int:
+    from app.core.database import close_mongo_connection, connect_to_mongo
+    from app.core.indexes import ensure_indexes
+    
+    await connect_to_mongo()
+    try:
+        if ensure:
+            await ensure_indexes()
+        issues = await check_query_plans()
+    finally:
+        await close_mongo_connection()
+    
+    for issue in issues:
+        print(f"✗ {issue}")
+    if issues:
+        return 1
+    print(f"✓ All {len(CANONICAL_QUERIES)} canonical queries use indexes")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Flag service queries that scan collections or sort in memory")
+    parser.add_argument("--ensure-indexes", action="store_true", help="Create the registry indexes first")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(_main(args.ensure_indexes)))
@@ -0,0 +1,189 @@
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+
+
+def _tag_keys(tags: Iterable[str]) -> Tuple[str, ...]:
+    return tuple({tag.lower() for tag in tags or () if isinstance(tag, str)})
+
+
+class _Postings:
+    """Slots carrying a term, kept in a growable array in indexing order,
+    so reads slice it directly and writes update it in place"""
+    
+    __slots__ = ("array", "size")
+    
+    def __init__(self):
+        self.array = np.empty(8, dtype=np.int64)
+        self.size = 0
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def add(self, slot: int) -> None:
+        if self.size == len(self.array):
+            grown = np.empty(2 * len(self.array), dtype=np.int64)
+            grown[:self.size] = self.array[:self.size]
+            self.array = grown
+        self.array[self.size] = slot
+        self.size += 1
+    
+    def discard(self, slot: int) -> None:
+        hits = np.flatnonzero(self.array[:self.size] == slot)
+        if len(hits):
+            # Shift the tail down rather than swapping, to keep indexing order
+            position = hits[0]
+            self.array[position:self.size - 1] = self.array[position + 1:self.size]
+            self.size -= 1
+    
+    def latest(self, count: int) -> np.ndarray:
+        """The ``count`` most recently indexed slots"""
+        return self.array[max(0, self.size - count):self.size]
+
+
+class RelatedContentIndex:
+    """In-memory tag/category similarity index over content items.
+    
+    Items occupy integer slots. Each tag keeps a posting list of the slots
+    carrying it (the columns of a sparse tag-item matrix), and per-slot
+    categories and creation times live in NumPy arrays. Scoring an item is
+    then a sparse matrix-vector product done with a few vectorized calls:
+    concatenate the posting lists of its tags, weight each tag by its inverse
+    document frequency, and sum per candidate. Candidates sharing the
+    category get ``category_weight`` on top, and ties go to the newest item.
+    
+    To keep lookups fast with very common tags, only the ``posting_limit``
+    most recently indexed items of each posting list are scored. Category
+    postings are only read when the tags yield fewer than ``limit``
+    candidates (e.g. for an untagged item), to fill the rest with recent
+    items from the same category.
+    """
+    
+    def __init__(self, category_weight: float = 1.0, posting_limit: int = 2000):
+        self.category_weight = category_weight
+        self.posting_limit = posting_limit
+        self._slots: Dict[str, int] = {}
+        self._ids: List[Optional[str]] = []
+        self._free: List[int] = []
+        self._tags: Dict[int, Tuple[str, ...]] = {}
+        self._postings: Dict[str, _Postings] = {}
+        self._category_codes: Dict[str, int] = {}
+        self._category_postings: Dict[int, _Postings] = {}
+        self._categories = np.full(0, -1, dtype=np.int32)
+        self._created = np.zeros(0, dtype=np.float64)
+    
+    def __len__(self) -> int:
+        return len(self._slots)
+    
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._slots
+    
+    def _allocate(self, item_id: str) -> int:
+        if self._free:
+            slot = self._free.pop()
+            self._ids[slot] = item_id
+        else:
+            slot = len(self._ids)
+            self._ids.append(item_id)
+            if slot >= len(self._created):
+                capacity = max(1024, 2 * len(self._created))
+                categories = np.full(capacity, -1, dtype=np.int32)
+                categories[:len(self._categories)] = self._categories
+                created = np.zeros(capacity, dtype=np.float64)
+                created[:len(self._created)] = self._created
+                self._categories, self._created = categories, created
+        self._slots[item_id] = slot
+        return slot
+    
+    def _category_code(self, category: Optional[str]) -> int:
+        if not category:
+            return -1
+        return self._category_codes.setdefault(category, len(self._category_codes))
+    
+    def upsert(self, item_id: str, tags: Iterable[str], category: Optional[str], created_at: float) -> None:
+        """Add an item, or replace its tags and category"""
+        self.remove(item_id)
+        slot = self._allocate(item_id)
+        keys = _tag_keys(tags)
+        self._tags[slot] = keys
+        for key in keys:
+            self._postings.setdefault(key, _Postings()).add(slot)
+        code = self._category_code(category)
+        if code >= 0:
+            self._category_postings.setdefault(code, _Postings()).add(slot)
+        self._categories[slot] = code
+        self._created[slot] = created_at
+    
+    def remove(self, item_id: str) -> None:
+        """Drop an item from the index"""
+        slot = self._slots.pop(item_id, None)
+        if slot is None:
+            return
+        for key in self._tags.pop(slot, ()):
+            posting = self._postings[key]
+            posting.discard(slot)
+            if not posting:
+                del self._postings[key]
+        code = int(self._categories[slot])
+        if code >= 0:
+            posting = self._category_postings[code]
+            posting.discard(slot)
+            if not posting:
+                del self._category_postings[code]
+        self._ids[slot] = None
+        self._categories[slot] = -1
+        self._free.append(slot)
+    
+    def _score_tags(self, keys: List[str], code: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Candidate slots sharing at least one tag, and their scores"""
+        if not keys:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+        total = len(self._slots)
+        postings = [self._postings[key] for key in keys]
+        arrays = [posting.latest(self.posting_limit) for posting in postings]
+        weights = np.repeat(
+            [math.log(1 + total / len(posting)) for posting in postings],
+            [len(array) for array in arrays]
+        )
+        candidates, inverse = np.unique(np.concatenate(arrays), return_inverse=True)
+        scores = np.bincount(inverse, weights=weights)
+        if code >= 0:
+            scores += self.category_weight * (self._categories[candidates] == code)
+        return candidates, scores
+    
+    def _recent_in_category(self, code: int, count: int, skip: np.ndarray) -> np.ndarray:
+        """Up to ``count`` recent slots in a category outside ``skip``, newest first"""
+        posting = self._category_postings.get(code)
+        if posting is None or count <= 0:
+            return np.zeros(0, dtype=np.int64)
+        slots = posting.latest(count + len(skip))
+        slots = slots[~np.isin(slots, skip)]
+        slots = slots[np.argsort(-self._created[slots], kind="stable")]
+        return slots[:count]
+    
+    def _rank(self, keys: Iterable[str], code: int, limit: int, excluded: Optional[int]) -> List[str]:
+        keys = [key for key in keys if key in self._postings]
+        candidates, scores = self._score_tags(keys, code)
+        if excluded is not None:
+            keep = candidates != excluded
+            candidates, scores = candidates[keep], scores[keep]
+        
+        # Highest score first, newest first among equal scores
+        ranked = candidates[np.lexsort((-self._created[candidates], -scores))[:limit]]
+        if len(ranked) < limit:
+            skip = candidates if excluded is None else np.append(candidates, excluded)
+            ranked = np.concatenate([ranked, self._recent_in_category(code, limit - len(ranked), skip)])
+        return [self._ids[slot] for slot in ranked]
+    
+    def similar(self, tags: Iterable[str], category: Optional[str] = None, limit: int = 10) -> List[str]:
+        """IDs of the items most similar to the given tags and category"""
+        code = self._category_codes.get(category, -1) if category else -1
+        return self._rank(_tag_keys(tags), code, limit, None)
+    
+    def related(self, item_id: str, limit: int = 10) -> Optional[List[str]]:
+        """IDs of the items most similar to an indexed item, or None if the
+        item is not indexed"""
+        slot = self._slots.get(item_id)
+        if slot is None:
+            return None
+        return self._rank(self._tags[slot], int(self._categories[slot]), limit, slot)
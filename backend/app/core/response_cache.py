@@ -0,0 +1,173 @@
+import hashlib
+import logging
+import orjson
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+from app.core.cache import TTLCache
+from app.core.change_stream import change_watcher
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _default(value):
+    if isinstance(value, tuple):
+        return list(value)
+    raise TypeError
+
+
+def _digest(key: Hashable) -> str:
+    """Stable string form of a cache key, shared by every replica"""
+    return hashlib.sha1(orjson.dumps(key, default=_default)).hexdigest()
+
+
+class MemoryBackend:
+    """Per-replica cache backend. Cached values are shared, not copied."""
+    
+    name = "memory"
+    
+    def __init__(self, ttl: float, maxsize: int):
+        self._cache = TTLCache(ttl=ttl, maxsize=maxsize)
+        self._generations: Dict[str, int] = {}
+    
+    async def generation(self, namespace: str) -> int:
+        return self._generations.get(namespace, 0)
+    
+    async def bump(self, namespace: str) -> None:
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+        self._cache.clear()
+    
+    async def get(self, key: str) -> Any:
+        return self._cache.get(key)
+    
+    async def set(self, key: str, value: Any) -> None:
+        self._cache.set(key, value)
+    
+    async def close(self) -> None:
+        self._cache.clear()
+
+
+class RedisBackend:
+    """Cache backend shared by all replicas through Redis (or a compatible
+    server). Values round-trip through JSON, so datetimes come back as ISO
+    strings and tuples as lists."""
+    
+    name = "redis"
+    
+    def __init__(self, url: str, ttl: float, prefix: str = "rc:"):
+        # Only needed for this backend
+        from redis import asyncio as aioredis
+        
+        self._redis = aioredis.from_url(url)
+        self._ttl_ms = int(ttl * 1000)
+        self._prefix = prefix
+    
+    async def generation(self, namespace: str) -> int:
+        return int(await self._redis.get(f"{self._prefix}gen:{namespace}") or 0)
+    
+    async def bump(self, namespace: str) -> None:
+        # Entries under the old generation are no longer read and expire on their own
+        await self._redis.incr(f"{self._prefix}gen:{namespace}")
+    
+    async def get(self, key: str) -> Any:
+        raw = await self._redis.get(self._prefix + key)
+        return orjson.loads(raw) if raw is not None else None
+    
+    async def set(self, key: str, value: Any) -> None:
+        await self._redis.set(self._prefix + key, orjson.dumps(value, default=_default), px=self._ttl_ms)
+    
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+class ResponseCache:
+    """Read-through cache for query results, invalidated per namespace.
+    
+    Keys embed the namespace's generation, so invalidating a namespace is a
+    single counter bump, and a result fetched before a write is never stored
+    under the generation that follows it. The cache only serves while the
+    change stream watcher is active, since that is what keeps other replicas'
+    writes visible; otherwise every call goes straight to ``fetch``.
+    """
+    
+    def __init__(self):
+        self.backend = None
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+    
+    def configure(self) -> None:
+        """Create the backend selected by ``response_cache_backend``"""
+        kind = settings.response_cache_backend
+        if kind == "memory":
+            self.backend = MemoryBackend(settings.response_cache_ttl_seconds, settings.response_cache_max_entries)
+        elif kind == "redis":
+            self.backend = RedisBackend(settings.redis_url, settings.response_cache_ttl_seconds)
+        elif kind != "none":
+            raise ValueError(f"Unknown response cache backend: {kind}")
+    
+    async def close(self) -> None:
+        if self.backend is not None:
+            await self.backend.close()
+            self.backend = None
+    
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None and change_watcher.active
+    
+    async def fetch(self, namespace: str, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Return the cached result for ``key``, or call ``fetch`` and cache it.
+        
+        ``None`` results are not cached. Backend errors are logged and the
+        call falls through to ``fetch``.
+        """
+        if not self.enabled:
+            return await fetch()
+        
+        backend = self.backend
+        try:
+            generation = await backend.generation(namespace)
+            entry_key = f"{namespace}:{generation}:{_digest(key)}"
+            cached = await backend.get(entry_key)
+        except Exception as e:
+            self.errors += 1
+            logger.warning("Response cache read failed: %s", e)
+            return await fetch()
+        
+        if cached is not None:
+            self.hits += 1
+            return cached
+        
+        self.misses += 1
+        value = await fetch()
+        if value is not None:
+            try:
+                await backend.set(entry_key, value)
+            except Exception as e:
+                self.errors += 1
+                logger.warning("Response cache write failed: %s", e)
+        return value
+    
+    async def invalidate(self, namespace: str) -> None:
+        """Drop every cached result in ``namespace``"""
+        if self.backend is None:
+            return
+        try:
+            await self.backend.bump(namespace)
+        except Exception as e:
+            self.errors += 1
+            logger.warning("Response cache invalidation failed: %s", e)
+    
+    def stats(self) -> dict:
+        """Backend, state and hit/miss counters"""
+        return {
+            "backend": self.backend.name if self.backend is not None else None,
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors
+        }
+
+
+response_cache = ResponseCache()
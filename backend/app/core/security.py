@@ -1,5 +1,7 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
@@ -18,6 +20,61 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+# bcrypt is deliberately slow (~100-300 ms) and releases the GIL, so hashing
+# runs on a dedicated thread pool instead of blocking the event loop
+_password_executor = (
+    ThreadPoolExecutor(max_workers=settings.password_hash_workers, thread_name_prefix="password-hash")
+    if settings.password_hash_workers > 0 else None
+)
+_password_slots: Optional[asyncio.Semaphore] = None
+_password_stats = {"waiting": 0, "running": 0, "completed": 0}
+
+
+async def _run_password_task(func: Callable, *args):
+    """Run a bcrypt operation on the password pool, bounded by a semaphore"""
+    global _password_slots
+    if _password_executor is None:
+        return func(*args)
+    
+    if _password_slots is None:
+        _password_slots = asyncio.Semaphore(settings.password_hash_workers)
+    
+    _password_stats["waiting"] += 1
+    try:
+        await _password_slots.acquire()
+    finally:
+        _password_stats["waiting"] -= 1
+    
+    _password_stats["running"] += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_password_executor, func, *args)
+    finally:
+        _password_stats["running"] -= 1
+        _password_stats["completed"] += 1
+        _password_slots.release()
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against a hash without blocking the event loop"""
+    return await _run_password_task(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password without blocking the event loop"""
+    return await _run_password_task(get_password_hash, password)
+
+
+def password_hasher_stats() -> dict:
+    """Get password pool queue depth and throughput counters"""
+    return {
+        "workers": settings.password_hash_workers,
+        "queue_depth": _password_stats["waiting"],
+        "running": _password_stats["running"],
+        "completed": _password_stats["completed"]
+    }
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token"""
     to_encode = data.copy()
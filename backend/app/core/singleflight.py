@@ -0,0 +1,61 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, List, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesce concurrent identical async calls into one in-flight call.
+    
+    The first caller for a key starts the call; callers arriving while it is
+    still running await the same result instead of starting their own. The
+    result is shared, so callers must treat it as read-only. Nothing is kept
+    once the call finishes, so this never serves stale data by itself.
+    """
+    
+    instances: List["SingleFlight"] = []
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.coalesced = 0
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        SingleFlight.instances.append(self)
+    
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Run ``func`` for ``key``, or join the call already in flight"""
+        self.calls += 1
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._release(key, done))
+        
+        # Shield the shared call so one cancelled waiter does not cancel it
+        # for everyone else
+        return await asyncio.shield(task)
+    
+    def _release(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every waiter went away
+            task.exception()
+    
+    def forget(self) -> None:
+        """Stop handing out calls that are already in flight.
+        
+        Called after a write, so requests arriving later start a fresh call
+        that is guaranteed to observe the write.
+        """
+        self._inflight.clear()
+    
+    def stats(self) -> dict:
+        """Call and coalescing counters"""
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight)
+        }
@@ -0,0 +1,64 @@
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Tuple
+
+
+class TagIndex:
+    """In-memory prefix index of tag names and their usage counts.
+    
+    Names are kept in a sorted list of lowercased keys, so a prefix lookup is
+    a binary search followed by a scan over just the matching range. Counts
+    can be adjusted incrementally; a tag is dropped when its count hits zero.
+    """
+    
+    def __init__(self):
+        self._keys: List[str] = []
+        self._counts: Dict[str, int] = {}
+        self._names: Dict[str, str] = {}
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def load(self, counts: Iterable[Tuple[str, int]]) -> None:
+        """Replace the index contents with ``(tag, count)`` pairs"""
+        self._counts, self._names = {}, {}
+        for name, count in counts:
+            if not isinstance(name, str) or count <= 0:
+                continue
+            key = name.lower()
+            self._counts[key] = self._counts.get(key, 0) + count
+            self._names.setdefault(key, name)
+        self._keys = sorted(self._counts)
+    
+    def add(self, tags: Iterable[str], delta: int = 1) -> None:
+        """Adjust the usage count of each tag by ``delta``"""
+        for name in tags:
+            if not isinstance(name, str):
+                continue
+            key = name.lower()
+            count = self._counts.get(key, 0) + delta
+            if count > 0:
+                if key not in self._counts:
+                    insort(self._keys, key)
+                    self._names[key] = name
+                self._counts[key] = count
+            elif key in self._counts:
+                del self._counts[key]
+                del self._names[key]
+                self._keys.pop(bisect_left(self._keys, key))
+    
+    def remove(self, tags: Iterable[str]) -> None:
+        """Decrement the usage count of each tag"""
+        self.add(tags, -1)
+    
+    def suggest(self, prefix: str, limit: int = 10) -> List[Tuple[str, int]]:
+        """Tags starting with ``prefix`` (case-insensitive), most used first"""
+        prefix = prefix.lower()
+        matches = []
+        for position in range(bisect_left(self._keys, prefix), len(self._keys)):
+            key = self._keys[position]
+            if not key.startswith(prefix):
+                break
+            matches.append(key)
+        
+        matches.sort(key=lambda key: (-self._counts[key], key))
+        return [(self._names[key], self._counts[key]) for key in matches[:limit]]
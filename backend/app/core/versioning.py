@@ -0,0 +1,64 @@
+from uuid import uuid4
+from pymongo import ReturnDocument
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import get_database
+
+
+class CollectionVersions:
+    """Per-collection change counters shared by all replicas through MongoDB.
+    
+    Every write to a versioned collection bumps its counter, so a version
+    token identifies the collection's contents and can back HTTP validators.
+    Each counter carries a random epoch, so recreating the document never
+    reissues a token that was handed out before.
+    """
+    
+    # Other replicas' bumps become visible within this TTL; bumps made on
+    # this replica are visible immediately
+    _cache = TTLCache(ttl=settings.etag_version_ttl_seconds, maxsize=64)
+    
+    @staticmethod
+    def _token(doc: dict) -> str:
+        return f"{doc['epoch']}.{doc['version']}"
+    
+    @staticmethod
+    async def get(name: str) -> str:
+        """Get the current version token of a collection"""
+        token = CollectionVersions._cache.get(name)
+        if token is not None:
+            return token
+        
+        db = get_database()
+        doc = await db.collection_versions.find_one({"_id": name})
+        if doc is None:
+            doc = await db.collection_versions.find_one_and_update(
+                {"_id": name},
+                {"$setOnInsert": {"epoch": uuid4().hex, "version": 0}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+        
+        token = CollectionVersions._token(doc)
+        CollectionVersions._cache.set(name, token)
+        return token
+    
+    @staticmethod
+    def forget(name: str) -> None:
+        """Drop the locally cached token, e.g. after another replica's write"""
+        CollectionVersions._cache.delete(name)
+    
+    @staticmethod
+    async def bump(name: str) -> str:
+        """Record a change to a collection and return its new version token"""
+        db = get_database()
+        doc = await db.collection_versions.find_one_and_update(
+            {"_id": name},
+            {"$inc": {"version": 1}, "$setOnInsert": {"epoch": uuid4().hex}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        
+        token = CollectionVersions._token(doc)
+        CollectionVersions._cache.set(name, token)
+        return token
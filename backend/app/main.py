@@ -1,9 +1,20 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.core.change_stream import change_watcher
 from app.core.database import connect_to_mongo, close_mongo_connection
-from app.api.v1 import content_routes, auth_routes
-from app.api import health_check
+from app.core.indexes import start_index_build
+from app.core.metrics import MetricsMiddleware
+from app.core.profiling import ServerTimingMiddleware, TimedORJSONResponse
+from app.core.response_cache import response_cache
+from app.core.versioning import CollectionVersions
+from app.api.v1 import content_routes, auth_routes, tag_routes
+from app.api import health_check, metrics
+from app.services.author_service import AuthorService
+from app.services.category_service import CategoryService
+from app.services.related_service import INDEXED_FIELDS, RelatedService
+from app.services.tag_service import TagService
+from app.services.view_service import view_counter
 
 # Create FastAPI app
 app = FastAPI(
@@ -12,7 +23,8 @@ app = FastAPI(
     description="Backend API for Educated Guess Media Platform",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
-    openapi_url="/api/openapi.json"
+    openapi_url="/api/openapi.json",
+    default_response_class=TimedORJSONResponse
 )
 
 # CORS middleware
@@ -22,20 +34,56 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
+# Per-request Server-Timing and query budget logging
+if settings.server_timing_enabled:
+    app.add_middleware(ServerTimingMiddleware)
+
+# Prometheus request metrics (outermost, so they include CORS handling)
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
 
 # Event handlers
 @app.on_event("startup")
 async def startup_event():
     """Run on application startup"""
     await connect_to_mongo()
+    if settings.ensure_indexes_on_startup:
+        start_index_build()
+    
+    # Writes from other replicas invalidate this replica's caches
+    response_cache.configure()
+    change_watcher.subscribe("content_items", lambda: response_cache.invalidate("content"))
+    change_watcher.subscribe("content_items", lambda: CollectionVersions.forget("content_items"))
+    change_watcher.subscribe_documents("content_items", RelatedService.apply_change, INDEXED_FIELDS)
+    change_watcher.subscribe_documents("content_items", TagService.apply_change, ["tags"])
+    change_watcher.subscribe("categories", CategoryService.invalidate_cache)
+    change_watcher.subscribe("categories", lambda: CollectionVersions.forget("categories"))
+    change_watcher.subscribe("authors", AuthorService.invalidate_cache)
+    change_watcher.subscribe("authors", lambda: CollectionVersions.forget("authors"))
+    # View count flushes only touch views and trending_score, which cached
+    # and ETag'd reads leave out; /content/trending reads them uncached
+    change_watcher.ignore_updates_to("trending_score")
+    await change_watcher.start()
+    await view_counter.start()
+    await RelatedService.refresher.start()
+    await TagService.refresher.start()
+    
     print(f"🚀 {settings.app_name} v{settings.app_version} started")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Run on application shutdown"""
+    # Drain buffered views while the database connection is still open
+    await view_counter.stop()
+    await RelatedService.refresher.stop()
+    await TagService.refresher.stop()
+    await change_watcher.stop()
+    await response_cache.close()
     await close_mongo_connection()
 
 
@@ -52,5 +100,8 @@ async def root():
 
 # Include routers
 app.include_router(health_check.router, prefix="/api")
+if settings.metrics_enabled:
+    app.include_router(metrics.router)
 app.include_router(auth_routes.router, prefix=f"{settings.api_v1_prefix}/auth")
 app.include_router(content_routes.router, prefix=settings.api_v1_prefix)
+app.include_router(tag_routes.router, prefix=settings.api_v1_prefix)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional, List, Union
 from datetime import datetime
 
 
@@ -13,11 +13,42 @@ class ContentSchema(BaseModel):
     image_url: Optional[str] = None
     tags: List[str] = []
     created_at: datetime
+    score: Optional[float] = None
+    author: Optional["AuthorSchema"] = None
+    category: Optional["CategorySchema"] = None
     
     class Config:
         populate_by_name = True
 
 
+class ContentPartialSchema(BaseModel):
+    """Sparse content item response schema for ``fields=`` requests"""
+    id: str = Field(alias="_id")
+    title: Optional[str] = None
+    description: Optional[str] = None
+    category_id: Optional[str] = None
+    author_id: Optional[str] = None
+    image_url: Optional[str] = None
+    tags: Optional[List[str]] = None
+    created_at: Optional[datetime] = None
+    score: Optional[float] = None
+    author: Optional["AuthorSchema"] = None
+    category: Optional["CategorySchema"] = None
+    
+    class Config:
+        populate_by_name = True
+
+
+class TrendingContentSchema(ContentSchema):
+    """Trending content item response schema, with its view count"""
+    views: int = 0
+
+
+class TrendingContentPartialSchema(ContentPartialSchema):
+    """Sparse trending content item response schema, with its view count"""
+    views: int = 0
+
+
 class ContentCreateSchema(BaseModel):
     """Content item creation schema"""
     title: str = Field(..., min_length=1, max_length=200)
@@ -40,6 +71,42 @@ class ContentCreateSchema(BaseModel):
         }
 
 
+class ContentBatchGetSchema(BaseModel):
+    """Batch fetch request schema"""
+    ids: List[str] = Field(..., min_length=1)
+
+
+class ContentBatchResultSchema(BaseModel):
+    """Batch fetch response schema"""
+    items: List[Union["ContentSchema", "ContentPartialSchema"]] = []
+    missing: List[str] = []
+    invalid: List[str] = []
+
+
+class ContentUpsertSchema(ContentCreateSchema):
+    """Content item bulk upsert schema, keyed by the item ID"""
+    id: str = Field(alias="_id")
+    
+    class Config:
+        populate_by_name = True
+
+
+class BulkItemResultSchema(BaseModel):
+    """Outcome of a single item in a bulk write"""
+    index: int
+    status: str
+    id: Optional[str] = None
+    error: Optional[str] = None
+
+
+class BulkResultSchema(BaseModel):
+    """Bulk write response schema"""
+    created: int = 0
+    updated: int = 0
+    failed: int = 0
+    results: List[BulkItemResultSchema] = []
+
+
 class ContentUpdateSchema(BaseModel):
     """Content item update schema"""
     title: Optional[str] = Field(None, min_length=1, max_length=200)
@@ -50,6 +117,12 @@ class ContentUpdateSchema(BaseModel):
     tags: Optional[List[str]] = None
 
 
+class TagSuggestionSchema(BaseModel):
+    """Tag autocomplete suggestion schema"""
+    tag: str
+    count: int
+
+
 class CategorySchema(BaseModel):
     """Category response schema"""
     id: str = Field(alias="_id")
@@ -84,3 +157,11 @@ class AuthorCreateSchema(BaseModel):
     name: str = Field(..., min_length=1, max_length=100)
     bio: Optional[str] = None
     avatar_url: Optional[str] = None
+
+
+# Resolve the embedded author/category forward references
+ContentSchema.model_rebuild()
+ContentPartialSchema.model_rebuild()
+TrendingContentSchema.model_rebuild()
+TrendingContentPartialSchema.model_rebuild()
+ContentBatchResultSchema.model_rebuild()
@@ -0,0 +1,82 @@
+from typing import Dict, Iterable, List, Optional
+from bson import ObjectId
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import get_database
+from app.core.versioning import CollectionVersions
+from app.schemas.content_schema import AuthorCreateSchema
+
+
+class AuthorService:
+    """Service layer for author operations"""
+    
+    # Hot authors (bylines on the current pages) are served from memory
+    _cache = TTLCache(ttl=settings.author_cache_ttl_seconds, maxsize=settings.author_cache_max_entries)
+    
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop all cached authors"""
+        AuthorService._cache.clear()
+    
+    @staticmethod
+    def cache_stats() -> dict:
+        """Get author cache hit/miss counters"""
+        return AuthorService._cache.stats()
+    
+    @staticmethod
+    async def get_all_authors(limit: int = 100) -> List[dict]:
+        """Get all authors"""
+        db = get_database()
+        cursor = db.authors.find().sort("name", 1).limit(limit)
+        authors = await cursor.to_list(length=limit)
+        
+        for author in authors:
+            author["_id"] = str(author["_id"])
+        
+        return authors
+    
+    @staticmethod
+    async def get_many(author_ids: Iterable[Optional[str]]) -> Dict[str, dict]:
+        """Get authors by ID, keyed by ID.
+        
+        IDs are deduplicated, invalid ones are skipped, cached authors are
+        served from memory and the rest are fetched in a single ``$in`` query.
+        """
+        found: Dict[str, dict] = {}
+        missing = []
+        for author_id in set(author_ids):
+            if not author_id or not ObjectId.is_valid(author_id):
+                continue
+            cached = AuthorService._cache.get(author_id)
+            if cached is not None:
+                found[author_id] = dict(cached)
+            else:
+                missing.append(ObjectId(author_id))
+        
+        if missing:
+            db = get_database()
+            cursor = db.authors.find({"_id": {"$in": missing}})
+            for author in await cursor.to_list(length=len(missing)):
+                author["_id"] = str(author["_id"])
+                AuthorService._cache.set(author["_id"], dict(author))
+                found[author["_id"]] = author
+        
+        return found
+    
+    @staticmethod
+    async def get_author_by_id(author_id: str) -> Optional[dict]:
+        """Get a single author by ID"""
+        authors = await AuthorService.get_many([author_id])
+        return authors.get(author_id)
+    
+    @staticmethod
+    async def create_author(author: AuthorCreateSchema) -> dict:
+        """Create a new author"""
+        db = get_database()
+        
+        author_dict = author.model_dump()
+        await db.authors.insert_one(author_dict)
+        await CollectionVersions.bump("authors")
+        author_dict["_id"] = str(author_dict["_id"])
+        
+        return author_dict
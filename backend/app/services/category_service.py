@@ -1,22 +1,52 @@
 from typing import List, Optional
 from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.core.database import get_database
+from app.core.versioning import CollectionVersions
 from app.schemas.content_schema import CategoryCreateSchema
 
 
 class CategoryService:
     """Service layer for category operations"""
     
+    # Categories rarely change, so lookups are served from memory. Writes on
+    # this replica invalidate immediately; other replicas converge within the TTL.
+    _cache = TTLCache(ttl=settings.category_cache_ttl_seconds, maxsize=settings.category_cache_max_entries)
+    
+    @staticmethod
+    def _remember(category: dict) -> None:
+        """Cache a category under both its ID and slug"""
+        CategoryService._cache.set(("id", category["_id"]), category)
+        CategoryService._cache.set(("slug", category["slug"]), category)
+    
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop all cached categories"""
+        CategoryService._cache.clear()
+    
+    @staticmethod
+    def cache_stats() -> dict:
+        """Get category cache hit/miss counters"""
+        return CategoryService._cache.stats()
+    
     @staticmethod
     async def get_all_categories() -> List[dict]:
         """Get all categories"""
+        categories = CategoryService._cache.get("all")
+        if categories is not None:
+            return [dict(cat) for cat in categories]
+        
         db = get_database()
         cursor = db.categories.find()
         categories = await cursor.to_list(length=100)
         
         for cat in categories:
             cat["_id"] = str(cat["_id"])
+            CategoryService._remember(dict(cat))
         
+        CategoryService._cache.set("all", [dict(cat) for cat in categories])
         return categories
     
     @staticmethod
@@ -25,22 +55,32 @@ class CategoryService:
         if not ObjectId.is_valid(category_id):
             return None
         
+        cached = CategoryService._cache.get(("id", category_id))
+        if cached is not None:
+            return dict(cached)
+        
         db = get_database()
         category = await db.categories.find_one({"_id": ObjectId(category_id)})
         
         if category:
             category["_id"] = str(category["_id"])
+            CategoryService._remember(dict(category))
         
         return category
     
     @staticmethod
     async def get_category_by_slug(slug: str) -> Optional[dict]:
         """Get a category by slug"""
+        cached = CategoryService._cache.get(("slug", slug))
+        if cached is not None:
+            return dict(cached)
+        
         db = get_database()
         category = await db.categories.find_one({"slug": slug})
         
         if category:
             category["_id"] = str(category["_id"])
+            CategoryService._remember(dict(category))
         
         return category
     
@@ -49,14 +89,17 @@ class CategoryService:
         """Create a new category"""
         db = get_database()
         
-        # Check if slug already exists
-        existing = await db.categories.find_one({"slug": category.slug})
-        if existing:
+        category_dict = category.model_dump()
+        
+        # The unique slug index rejects duplicates atomically
+        try:
+            await db.categories.insert_one(category_dict)
+        except DuplicateKeyError:
             return None
         
-        category_dict = category.model_dump()
-        result = await db.categories.insert_one(category_dict)
-        created_category = await db.categories.find_one({"_id": result.inserted_id})
-        created_category["_id"] = str(created_category["_id"])
+        category_dict["_id"] = str(category_dict["_id"])
+        
+        CategoryService.invalidate_cache()
+        await CollectionVersions.bump("categories")
         
-        return created_category
+        return category_dict
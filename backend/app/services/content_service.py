@@ -1,70 +1,587 @@
-from typing import List, Optional
+import re
+from typing import AsyncIterator, Iterable, List, Optional, Set, Tuple
 from bson import ObjectId
+from pydantic import ValidationError
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
+from app.core.config import settings
 from app.core.database import get_database
-from app.schemas.content_schema import ContentCreateSchema, ContentUpdateSchema
+from app.core.pagination import encode_cursor, keyset_filter
+from app.core.response_cache import response_cache
+from app.core.singleflight import SingleFlight
+from app.core.versioning import CollectionVersions
+from app.schemas.content_schema import ContentSchema, ContentCreateSchema, ContentUpdateSchema, ContentUpsertSchema
+from app.services.author_service import AuthorService
+from app.services.category_service import CategoryService
+from app.services.related_service import RelatedService
+from app.services.tag_service import TagService
 from datetime import datetime
 
+# Keys that are computed per request rather than stored on the document
+_COMPUTED_KEYS = {"score", "author", "category"}
+
+# Embeddable references: expand name -> (reference key, collection)
+EXPANSIONS = {
+    "author": ("author_id", "authors"),
+    "category": ("category_id", "categories"),
+}
+
+# Response keys (by alias) and their defaults, in ContentSchema order. Reads
+# project to these fields and fill the defaults, so list pages can be
+# serialized directly without re-validating every item through Pydantic.
+_CONTENT_FIELDS = [
+    (field.alias or name, None if field.is_required() else field.get_default())
+    for name, field in ContentSchema.model_fields.items()
+]
+_CONTENT_DEFAULTS = dict(_CONTENT_FIELDS)
+CONTENT_PROJECTION = {key: 1 for key, _ in _CONTENT_FIELDS if key not in _COMPUTED_KEYS}
+
+# Accept both field names and aliases in ``fields=`` (e.g. "id" and "_id");
+# embedded references are requested through ``expand=`` instead
+_FIELD_KEYS = {}
+for _name, _field in ContentSchema.model_fields.items():
+    if _name in EXPANSIONS:
+        continue
+    _FIELD_KEYS[_name] = _FIELD_KEYS[_field.alias or _name] = _field.alias or _name
+
+
+def _utc_now() -> datetime:
+    """Current UTC time truncated to BSON's millisecond precision, so returned
+    documents match what later reads (and pagination cursors) see"""
+    now = datetime.utcnow()
+    return now.replace(microsecond=now.microsecond // 1000 * 1000)
+
+
+def _validation_message(error: ValidationError) -> str:
+    """Flatten a pydantic ValidationError into a single readable line"""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc']) or 'item'}: {err['msg']}"
+        for err in error.errors()
+    )
+
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Validate a comma-separated sparse fieldset against ContentSchema.
+    
+    Returns the response keys to include (``_id`` always first), or None for
+    the full document. Raises ValueError for unknown fields.
+    """
+    if not fields:
+        return None
+    
+    keys = ["_id"]
+    for name in fields.split(","):
+        name = name.strip()
+        if not name:
+            continue
+        key = _FIELD_KEYS.get(name)
+        if key is None:
+            raise ValueError(f"Unknown field: {name}")
+        if key not in keys:
+            keys.append(key)
+    
+    return keys
+
+
+def parse_expand(expand: Optional[str]) -> Set[str]:
+    """Validate a comma-separated ``expand`` parameter, raising ValueError
+    for unknown references"""
+    if not expand:
+        return set()
+    
+    names = {name.strip() for name in expand.split(",") if name.strip()}
+    unknown = names - EXPANSIONS.keys()
+    if unknown:
+        raise ValueError(f"Unknown expansion: {', '.join(sorted(unknown))}")
+    return names
+
+
+def content_keys(fields: Optional[List[str]] = None) -> List[str]:
+    """Response keys returned for a sparse fieldset (all keys when None)"""
+    return list(fields) if fields is not None else [key for key, _ in _CONTENT_FIELDS]
+
+
+def export_keys(fields: Optional[List[str]] = None) -> List[str]:
+    """Response keys included in exports: the stored fields only, since
+    computed keys (score, embedded references) are never filled there"""
+    return [key for key in content_keys(fields) if key not in _COMPUTED_KEYS]
+
+
+def content_projection(fields: Optional[List[str]] = None, *extra: str) -> dict:
+    """MongoDB projection for the requested response keys plus any extra
+    fields needed internally (e.g. the pagination sort key)"""
+    if fields is None:
+        return CONTENT_PROJECTION
+    projection = {key: 1 for key in fields if key not in _COMPUTED_KEYS}
+    projection.update({key: 1 for key in extra})
+    return projection
+
+
+def shape_content(item: dict, fields: Optional[List[str]] = None) -> dict:
+    """Shape a raw document exactly as ContentSchema would serialize it,
+    restricted to ``fields`` when a sparse fieldset was requested"""
+    if fields is None:
+        shaped = {key: item.get(key, default) for key, default in _CONTENT_FIELDS}
+    else:
+        shaped = {key: item.get(key, _CONTENT_DEFAULTS[key]) for key in fields}
+    shaped["_id"] = str(shaped["_id"])
+    return shaped
+
+
+def _filter_conditions(
+    category: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    tags: Optional[List[str]] = None,
+    tag_mode: str = "any"
+) -> List[dict]:
+    """Query conditions for the category, tag and creation date filters.
+    
+    ``tag_mode`` is "any" to match items with at least one of ``tags`` or
+    "all" to require every one; both are served by the multikey tags index.
+    """
+    conditions = []
+    if category:
+        conditions.append({"category_id": category})
+    if tags:
+        if len(tags) == 1:
+            conditions.append({"tags": tags[0]})
+        else:
+            conditions.append({"tags": {"$all" if tag_mode == "all" else "$in": tags}})
+    created = {}
+    if created_after:
+        created["$gte"] = created_after
+    if created_before:
+        created["$lt"] = created_before
+    if created:
+        conditions.append({"created_at": created})
+    return conditions
+
+
+def _combine(conditions: List[dict]) -> dict:
+    """AND a list of query conditions together"""
+    if not conditions:
+        return {}
+    if len(conditions) == 1:
+        return conditions[0]
+    return {"$and": conditions}
+
+
+# Query builders for the content reads, each returning (filter, sort). The
+# query plan checker explains exactly these, so keep hot-path reads on them.
+
+def list_query(
+    category: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    tags: Optional[List[str]] = None,
+    tag_mode: str = "any",
+    cursor: Optional[str] = None
+) -> Tuple[dict, list]:
+    """Filtered content list, newest first, seeking past ``cursor``.
+    Raises ValueError for a malformed cursor."""
+    conditions = _filter_conditions(category, created_after, created_before, tags, tag_mode)
+    seek = keyset_filter(cursor)
+    if seek:
+        conditions.append(seek)
+    return _combine(conditions), [("created_at", -1), ("_id", -1)]
+
+
+def text_search_query(
+    term: str,
+    category: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    tags: Optional[List[str]] = None,
+    tag_mode: str = "any"
+) -> Tuple[dict, list]:
+    """Text index search, most relevant first"""
+    query = _combine(
+        [{"$text": {"$search": term}}]
+        + _filter_conditions(category, created_after, created_before, tags, tag_mode)
+    )
+    return query, [("score", {"$meta": "textScore"}), ("created_at", -1)]
+
+
+def title_prefix_query(
+    prefix: str,
+    category: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    tags: Optional[List[str]] = None,
+    tag_mode: str = "any"
+) -> Tuple[dict, list]:
+    """Title prefix match, newest first.
+    
+    Anchored, case-sensitive regexes keep tight bounds on the title index,
+    so the common capitalisations are matched explicitly instead of
+    using the ``i`` option.
+    """
+    variants = {prefix, prefix.lower(), prefix.upper(), prefix.capitalize()}
+    query = _combine(
+        [{"title": {"$in": [re.compile("^" + re.escape(v)) for v in sorted(variants)]}}]
+        + _filter_conditions(category, created_after, created_before, tags, tag_mode)
+    )
+    return query, [("created_at", -1)]
+
+
+def trending_query(sort: str = "trending") -> Tuple[dict, list]:
+    """Viewed items by trending score (``"trending"``) or total views (``"views"``)"""
+    if sort == "trending":
+        return {"trending_score": {"$exists": True}}, [("trending_score", -1), ("_id", -1)]
+    return {"views": {"$gt": 0}}, [("views", -1), ("_id", -1)]
+
 
 class ContentService:
     """Service layer for content operations"""
     
+    # Concurrent identical reads share one database call; results are
+    # shared between callers and must not be mutated
+    _reads = SingleFlight("content_reads")
+    
+    @staticmethod
+    async def _content_changed() -> None:
+        """Record a write to content_items"""
+        ContentService._reads.forget()
+        await response_cache.invalidate("content")
+        await CollectionVersions.bump("content_items")
+    
     @staticmethod
     async def get_all_content(
         category: Optional[str] = None,
         search: Optional[str] = None,
-        limit: int = 50
-    ) -> List[dict]:
-        """Get all content items with optional filtering"""
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        tags: Optional[List[str]] = None,
+        tag_mode: str = "any"
+    ) -> Tuple[List[dict], Optional[str]]:
+        """Get a page of content items with optional filtering.
+        
+        Returns the items and an opaque cursor for the next page (``None`` when
+        there are no more items). Raises ValueError for a malformed cursor.
+        Search results are ranked by relevance and are not paginated.
+        ``fields`` restricts the returned keys (see ``parse_fields``).
+        Concurrent identical calls are coalesced into one query, and results
+        are served from the response cache when it is enabled.
+        """
+        key = (
+            "list", category, search, limit, cursor,
+            tuple(fields) if fields is not None else None,
+            created_after, created_before,
+            tuple(tags) if tags else None, tag_mode
+        )
+        return await ContentService._reads.do(key, lambda: response_cache.fetch(
+            "content", key, lambda: ContentService._fetch_content_page(
+                category, search, limit, cursor, fields, created_after, created_before, tags, tag_mode
+            )
+        ))
+    
+    @staticmethod
+    async def _fetch_content_page(
+        category: Optional[str],
+        search: Optional[str],
+        limit: int,
+        cursor: Optional[str],
+        fields: Optional[List[str]],
+        created_after: Optional[datetime],
+        created_before: Optional[datetime],
+        tags: Optional[List[str]] = None,
+        tag_mode: str = "any"
+    ) -> Tuple[List[dict], Optional[str]]:
+        """Query one page of content items (see ``get_all_content``)"""
+        if search and search.strip():
+            items = await ContentService.search_content(
+                search, category, limit, fields, created_after, created_before, tags, tag_mode
+            )
+            return items, None
+        
         db = get_database()
+        query, sort = list_query(category, created_after, created_before, tags, tag_mode, cursor)
+        
+        # Fetch one extra item to find out whether another page exists
+        db_cursor = (
+            db.content_items.find(query, content_projection(fields, "created_at"))
+            .sort(sort)
+            .limit(limit + 1)
+        )
+        items = await db_cursor.to_list(length=limit + 1)
         
-        # Build query
-        query = {}
-        if category:
-            query["category_id"] = category
-        if search:
-            query["$or"] = [
-                {"title": {"$regex": search, "$options": "i"}},
-                {"description": {"$regex": search, "$options": "i"}},
-                {"tags": {"$regex": search, "$options": "i"}}
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            last = items[-1]
+            next_cursor = encode_cursor(last["created_at"], last["_id"])
+        
+        return [shape_content(item, fields) for item in items], next_cursor
+    
+    @staticmethod
+    async def get_trending(
+        sort: str = "trending",
+        limit: int = 20,
+        fields: Optional[List[str]] = None
+    ) -> List[dict]:
+        """Get the most viewed items, ranked by time-decayed trending score
+        (``sort="trending"``) or by total views (``sort="views"``).
+        
+        Only items with at least one recorded view are included, each with its
+        ``views`` count. View counts change with every flush, so they are
+        served only here and never through the cached, ETag'd reads.
+        Concurrent identical calls are coalesced into one query.
+        """
+        key = ("trending", sort, limit, tuple(fields) if fields is not None else None)
+        
+        async def fetch() -> List[dict]:
+            db = get_database()
+            query, order = trending_query(sort)
+            cursor = (
+                db.content_items.find(query, {**content_projection(fields), "views": 1})
+                .sort(order)
+                .limit(limit)
+            )
+            return [
+                {**shape_content(item, fields), "views": item.get("views", 0)}
+                for item in await cursor.to_list(length=limit)
             ]
         
-        # Fetch content items
-        cursor = db.content_items.find(query).sort("created_at", -1).limit(limit)
+        return await ContentService._reads.do(key, fetch)
+    
+    @staticmethod
+    async def search_content(
+        search: str,
+        category: Optional[str] = None,
+        limit: int = 50,
+        fields: Optional[List[str]] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        tags: Optional[List[str]] = None,
+        tag_mode: str = "any"
+    ) -> List[dict]:
+        """Search content items by relevance using the text index.
+        
+        Terms shorter than ``search_min_text_length`` cannot be matched by the
+        stemmed text index, so they fall back to an indexed title prefix match.
+        The text index only matches whole words, so when it returns fewer
+        than ``limit`` items, titles starting with the query (or with its
+        last word, which may still be being typed) fill the remaining places.
+        """
+        db = get_database()
+        term = search.strip()
+        
+        if len(term) < settings.search_min_text_length:
+            return await ContentService._search_title_prefix(
+                term, category, limit, fields, created_after, created_before, tags, tag_mode
+            )
+        
+        query, sort = text_search_query(term, category, created_after, created_before, tags, tag_mode)
+        
+        cursor = (
+            db.content_items.find(query, {**content_projection(fields), "score": {"$meta": "textScore"}})
+            .sort(sort)
+            .limit(limit)
+        )
+        items = [shape_content(item, fields) for item in await cursor.to_list(length=limit)]
+        
+        prefixes = [term]
+        last_word = term.split()[-1]
+        if last_word != term and len(last_word) >= settings.search_min_text_length:
+            prefixes.append(last_word)
+        seen = {item["_id"] for item in items}
+        for prefix in prefixes:
+            if len(items) >= limit:
+                break
+            for item in await ContentService._search_title_prefix(
+                prefix, category, limit - len(items), fields, created_after, created_before, tags, tag_mode
+            ):
+                if item["_id"] not in seen:
+                    seen.add(item["_id"])
+                    items.append(item)
+        
+        return items
+    
+    @staticmethod
+    async def _search_title_prefix(
+        prefix: str,
+        category: Optional[str] = None,
+        limit: int = 50,
+        fields: Optional[List[str]] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        tags: Optional[List[str]] = None,
+        tag_mode: str = "any"
+    ) -> List[dict]:
+        """Match titles starting with a short prefix (see ``title_prefix_query``)"""
+        db = get_database()
+        query, sort = title_prefix_query(prefix, category, created_after, created_before, tags, tag_mode)
+        
+        cursor = db.content_items.find(query, content_projection(fields)).sort(sort).limit(limit)
         items = await cursor.to_list(length=limit)
         
-        # Convert ObjectId to string
+        return [shape_content(item, fields) for item in items]
+    
+    @staticmethod
+    async def expand_references(items: List[dict], expand: Iterable[str]) -> List[dict]:
+        """Embed referenced authors and categories into content items.
+        
+        Each referenced collection is resolved with at most one batched
+        ``$in`` query per call, and usually straight from the author and
+        category caches. Returns new dicts and leaves ``items`` untouched.
+        """
+        expand = set(expand)
+        if not expand or not items:
+            return items
+        
+        embedded = {}
+        if "author" in expand:
+            author_ids = {item.get("author_id") for item in items}
+            embedded["author"] = await AuthorService.get_many(author_ids)
+        if "category" in expand:
+            category_ids = {item.get("category_id") for item in items}
+            embedded["category"] = await ContentService._get_categories(category_ids)
+        
+        expanded = []
         for item in items:
-            item["_id"] = str(item["_id"])
+            item = dict(item)
+            for name, lookup in embedded.items():
+                reference_key = EXPANSIONS[name][0]
+                item[name] = lookup.get(item.get(reference_key))
+            expanded.append(item)
+        return expanded
+    
+    @staticmethod
+    async def _get_categories(category_ids: Set[Optional[str]]) -> dict:
+        """Resolve categories by ID from the category cache"""
+        categories = {cat["_id"]: cat for cat in await CategoryService.get_all_categories()}
         
-        return items
+        # get_all_categories is capped, so look up any stragglers individually
+        for category_id in category_ids:
+            if category_id and category_id not in categories:
+                category = await CategoryService.get_category_by_id(category_id)
+                if category:
+                    categories[category_id] = category
+        
+        return categories
     
     @staticmethod
-    async def get_content_by_id(item_id: str) -> Optional[dict]:
-        """Get a single content item by ID"""
+    async def iter_content(
+        category: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        fields: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        tag_mode: str = "any"
+    ) -> AsyncIterator[dict]:
+        """Stream every matching content item, newest first.
+        
+        Documents are pulled from the server ``export_batch_size`` at a time
+        and shaped one by one, so memory stays flat regardless of how many
+        items match. Items carry the ``export_keys`` for ``fields``.
+        """
+        db = get_database()
+        query, sort = list_query(category, created_after, created_before, tags, tag_mode)
+        keys = export_keys(fields)
+        
+        cursor = (
+            db.content_items.find(query, content_projection(fields))
+            .sort(sort)
+            .batch_size(settings.export_batch_size)
+        )
+        try:
+            async for item in cursor:
+                yield shape_content(item, keys)
+        finally:
+            await cursor.close()
+    
+    @staticmethod
+    async def get_content_by_id(item_id: str, fields: Optional[List[str]] = None) -> Optional[dict]:
+        """Get a single content item by ID, optionally restricted to ``fields``.
+        
+        Concurrent identical calls are coalesced into one query, and results
+        are served from the response cache when it is enabled.
+        """
         if not ObjectId.is_valid(item_id):
             return None
         
+        key = ("item", item_id, tuple(fields) if fields is not None else None)
+        return await ContentService._reads.do(key, lambda: response_cache.fetch(
+            "content", key, lambda: ContentService._fetch_content_item(item_id, fields)
+        ))
+    
+    @staticmethod
+    async def _fetch_content_item(item_id: str, fields: Optional[List[str]]) -> Optional[dict]:
+        """Query a single content item (see ``get_content_by_id``)"""
         db = get_database()
-        item = await db.content_items.find_one({"_id": ObjectId(item_id)})
+        item = await db.content_items.find_one({"_id": ObjectId(item_id)}, content_projection(fields))
         
         if item:
-            item["_id"] = str(item["_id"])
+            item = shape_content(item, fields)
         
         return item
     
+    @staticmethod
+    async def get_related(item_id: str, limit: int = 10, fields: Optional[List[str]] = None) -> Optional[List[dict]]:
+        """Get the items most related to ``item_id`` by tag and category
+        overlap, best first, or None if the item does not exist"""
+        related_ids = await RelatedService.get_related_ids(item_id, limit)
+        if related_ids is None:
+            return None
+        if not related_ids:
+            return []
+        return (await ContentService.get_content_by_ids(related_ids, fields))["items"]
+    
+    @staticmethod
+    async def get_content_by_ids(item_ids: List[str], fields: Optional[List[str]] = None) -> dict:
+        """Get many content items by ID with a single ``$in`` query.
+        
+        Items come back in request order (duplicates collapsed). IDs that
+        are not valid ObjectIds are reported as ``invalid`` and IDs with no
+        matching item as ``missing``, without failing the batch.
+        """
+        ordered, invalid, seen = [], [], set()
+        for item_id in item_ids:
+            if item_id in seen:
+                continue
+            seen.add(item_id)
+            if ObjectId.is_valid(item_id):
+                ordered.append(item_id)
+            else:
+                invalid.append(item_id)
+        
+        found = {}
+        if ordered:
+            db = get_database()
+            cursor = db.content_items.find(
+                {"_id": {"$in": [ObjectId(item_id) for item_id in ordered]}},
+                content_projection(fields)
+            )
+            for item in await cursor.to_list(length=len(ordered)):
+                shaped = shape_content(item, fields)
+                found[shaped["_id"]] = shaped
+        
+        return {
+            "items": [found[item_id] for item_id in ordered if item_id in found],
+            "missing": [item_id for item_id in ordered if item_id not in found],
+            "invalid": invalid
+        }
+    
     @staticmethod
     async def create_content(content: ContentCreateSchema) -> dict:
         """Create a new content item"""
         db = get_database()
         
         content_dict = content.model_dump()
-        content_dict["created_at"] = datetime.utcnow()
+        content_dict["created_at"] = _utc_now()
         
-        result = await db.content_items.insert_one(content_dict)
-        created_item = await db.content_items.find_one({"_id": result.inserted_id})
-        created_item["_id"] = str(created_item["_id"])
+        # insert_one assigns the _id in place, so no read-back is needed
+        await db.content_items.insert_one(content_dict)
+        TagService.record_change(content_dict["_id"], added=content_dict.get("tags") or [])
+        RelatedService.record_item(content_dict)
+        await ContentService._content_changed()
+        content_dict["_id"] = str(content_dict["_id"])
         
-        return created_item
+        return content_dict
     
     @staticmethod
     async def update_content(item_id: str, content: ContentUpdateSchema) -> Optional[dict]:
@@ -80,15 +597,23 @@ class ContentService:
         if not update_data:
             return None
         
-        result = await db.content_items.update_one(
+        # Read the document as it was before the update, so the tag index can
+        # be adjusted; the updated document is the old one with $set applied
+        previous = await db.content_items.find_one_and_update(
             {"_id": ObjectId(item_id)},
-            {"$set": update_data}
+            {"$set": update_data},
+            return_document=ReturnDocument.BEFORE
         )
         
-        if result.matched_count == 0:
+        if previous is None:
             return None
         
-        updated_item = await db.content_items.find_one({"_id": ObjectId(item_id)})
+        updated_item = {**previous, **update_data}
+        if "tags" in update_data:
+            TagService.record_change(item_id, added=update_data["tags"], removed=previous.get("tags") or [])
+        if "tags" in update_data or "category_id" in update_data:
+            RelatedService.record_item(updated_item)
+        await ContentService._content_changed()
         updated_item["_id"] = str(updated_item["_id"])
         
         return updated_item
@@ -100,6 +625,132 @@ class ContentService:
             return False
         
         db = get_database()
-        result = await db.content_items.delete_one({"_id": ObjectId(item_id)})
+        deleted = await db.content_items.find_one_and_delete({"_id": ObjectId(item_id)}, {"tags": 1})
+        
+        if deleted is None:
+            return False
+        
+        TagService.record_change(item_id, removed=deleted.get("tags") or [])
+        RelatedService.remove_item(item_id)
+        await ContentService._content_changed()
+        return True
+    
+    @staticmethod
+    async def bulk_create_content(items: List[dict]) -> dict:
+        """Validate and insert a batch of content items.
+        
+        Items are written with unordered ``insert_many`` in chunks of
+        ``bulk_write_chunk_size``, so one bad item does not stop the rest.
+        Returns per-item results in request order.
+        """
+        db = get_database()
+        results: List[Optional[dict]] = [None] * len(items)
+        created_at = _utc_now()
+        
+        docs, positions = [], []
+        for index, raw in enumerate(items):
+            try:
+                content = ContentCreateSchema.model_validate(raw)
+            except ValidationError as e:
+                results[index] = {"index": index, "status": "error", "error": _validation_message(e)}
+                continue
+            doc = content.model_dump()
+            doc["created_at"] = created_at
+            docs.append(doc)
+            positions.append(index)
+        
+        chunk_size = settings.bulk_write_chunk_size
+        for start in range(0, len(docs), chunk_size):
+            chunk = docs[start:start + chunk_size]
+            errors = {}
+            try:
+                await db.content_items.insert_many(chunk, ordered=False)
+            except BulkWriteError as e:
+                errors = {err["index"]: err.get("errmsg", "Write failed") for err in e.details.get("writeErrors", [])}
+            
+            for offset, doc in enumerate(chunk):
+                index = positions[start + offset]
+                if offset in errors:
+                    results[index] = {"index": index, "status": "error", "error": errors[offset]}
+                else:
+                    results[index] = {"index": index, "status": "created", "id": str(doc["_id"])}
+                    TagService.record_change(doc["_id"], added=doc.get("tags") or [])
+                    RelatedService.record_item(doc)
+        
+        return await ContentService._bulk_summary(results)
+    
+    @staticmethod
+    async def bulk_upsert_content(items: List[dict]) -> dict:
+        """Validate and upsert a batch of content items keyed by ``_id``.
+        
+        Existing items have the provided fields replaced; missing items are
+        created. Writes use unordered ``bulk_write`` in chunks of
+        ``bulk_write_chunk_size``. Returns per-item results in request order.
+        """
+        db = get_database()
+        results: List[Optional[dict]] = [None] * len(items)
+        created_at = _utc_now()
+        
+        operations, positions = [], []
+        for index, raw in enumerate(items):
+            try:
+                content = ContentUpsertSchema.model_validate(raw)
+            except ValidationError as e:
+                results[index] = {"index": index, "status": "error", "error": _validation_message(e)}
+                continue
+            if not ObjectId.is_valid(content.id):
+                results[index] = {"index": index, "status": "error", "error": "_id: Invalid ObjectId"}
+                continue
+            # Only the fields the client sent replace stored values; schema
+            # defaults apply to newly created items alone
+            fields = content.model_dump(exclude={"id"}, exclude_unset=True)
+            defaults = {
+                key: value for key, value in content.model_dump(exclude={"id"}).items()
+                if key not in fields
+            }
+            operations.append(UpdateOne(
+                {"_id": ObjectId(content.id)},
+                {"$set": fields, "$setOnInsert": {**defaults, "created_at": created_at}},
+                upsert=True
+            ))
+            positions.append((index, content.id))
+        
+        chunk_size = settings.bulk_write_chunk_size
+        for start in range(0, len(operations), chunk_size):
+            chunk = operations[start:start + chunk_size]
+            errors, upserted = {}, set()
+            try:
+                result = await db.content_items.bulk_write(chunk, ordered=False)
+                upserted = set(result.upserted_ids)
+            except BulkWriteError as e:
+                errors = {err["index"]: err.get("errmsg", "Write failed") for err in e.details.get("writeErrors", [])}
+                upserted = {entry["index"] for entry in e.details.get("upserted", [])}
+            
+            for offset in range(len(chunk)):
+                index, item_id = positions[start + offset]
+                if offset in errors:
+                    results[index] = {"index": index, "status": "error", "error": errors[offset]}
+                else:
+                    status = "created" if offset in upserted else "updated"
+                    results[index] = {"index": index, "status": status, "id": item_id}
+        
+        # Upserts replace tags without reading the previous values. The
+        # related index picks the upserted items up from the change stream.
+        if operations:
+            TagService.mark_stale()
+        
+        return await ContentService._bulk_summary(results)
+    
+    @staticmethod
+    async def _bulk_summary(results: List[dict]) -> dict:
+        """Count bulk results by status, recording the change if anything was written"""
+        summary = {"created": 0, "updated": 0, "failed": 0, "results": results}
+        for result in results:
+            if result["status"] == "error":
+                summary["failed"] += 1
+            else:
+                summary[result["status"]] += 1
         
-        return result.deleted_count > 0
+        if summary["created"] or summary["updated"]:
+            await ContentService._content_changed()
+        return summary
@@ -0,0 +1,121 @@
+from datetime import datetime
+from typing import Callable, List, Optional
+from bson import ObjectId
+from app.core.config import settings
+from app.core.database import get_database
+from app.core.index_refresher import IndexRefresher
+from app.core.related_index import RelatedContentIndex
+
+# Document fields the index is built from
+INDEXED_FIELDS = ("tags", "category_id", "created_at")
+
+
+def _created_timestamp(item: dict) -> float:
+    created_at = item.get("created_at")
+    return created_at.timestamp() if isinstance(created_at, datetime) else 0.0
+
+
+def _upsert(index: RelatedContentIndex, item: dict) -> None:
+    index.upsert(str(item["_id"]), item.get("tags") or [], item.get("category_id"), _created_timestamp(item))
+
+
+def _new_index() -> RelatedContentIndex:
+    return RelatedContentIndex(settings.related_category_weight, settings.related_posting_limit)
+
+
+class RelatedService:
+    """Service layer for related content recommendations"""
+    
+    # Built in the background at startup and rebuilt every
+    # related_index_ttl_seconds. In between, writes on this replica and
+    # change stream events (writes through any replica) update it one item
+    # at a time.
+    _index = _new_index()
+    # Changes made while a rebuild is reading the collection, replayed onto
+    # the new index before it is swapped in
+    _pending: Optional[List[Callable[[RelatedContentIndex], None]]] = None
+    
+    @staticmethod
+    async def _rebuild() -> None:
+        index = _new_index()
+        RelatedService._pending = []
+        try:
+            db = get_database()
+            # Oldest first, so posting lists end with the newest items, as
+            # they do after later writes
+            cursor = (
+                db.content_items.find({}, {field: 1 for field in INDEXED_FIELDS})
+                .sort([("created_at", 1), ("_id", 1)])
+            )
+            async for item in cursor.batch_size(settings.export_batch_size):
+                _upsert(index, item)
+            for change in RelatedService._pending:
+                change(index)
+            # Swap in the new index, so lookups never see a half-built one
+            RelatedService._index = index
+        finally:
+            RelatedService._pending = None
+    
+    refresher = IndexRefresher(
+        "related content",
+        lambda: RelatedService._rebuild(),
+        ttl=settings.related_index_ttl_seconds,
+        min_interval=settings.related_index_min_rebuild_seconds
+    )
+    
+    @staticmethod
+    def _apply(change: Callable[[RelatedContentIndex], None]) -> None:
+        if RelatedService._pending is not None:
+            # The rebuild may already have read past this item
+            RelatedService._pending.append(change)
+        if RelatedService.refresher.ready:
+            change(RelatedService._index)
+    
+    @staticmethod
+    def record_item(item: dict) -> None:
+        """Add or re-index a content item after a write"""
+        RelatedService._apply(lambda index: _upsert(index, item))
+    
+    @staticmethod
+    def remove_item(item_id: str) -> None:
+        """Drop a deleted content item from the index"""
+        RelatedService._apply(lambda index: index.remove(item_id))
+    
+    @staticmethod
+    def apply_change(event: Optional[dict]) -> None:
+        """Apply a content_items change stream event, or rebuild when
+        events may have been missed (``event`` is None)"""
+        if event is None:
+            RelatedService.refresher.mark_stale()
+            return
+        
+        if event["operationType"] == "update":
+            changed = (event.get("updatedFields") or []) + (event.get("removedFields") or [])
+            if not any(name.split(".")[0] in INDEXED_FIELDS for name in changed):
+                return
+        
+        document = event.get("fullDocument")
+        if event["operationType"] == "delete" or document is None:
+            RelatedService.remove_item(str(event["documentKey"]["_id"]))
+        else:
+            RelatedService.record_item(document)
+    
+    @staticmethod
+    async def get_related_ids(item_id: str, limit: int = 10) -> Optional[List[str]]:
+        """IDs of the items most related to ``item_id``, best first, or None
+        if the item does not exist. Until the first build completes, existing
+        items have no related items."""
+        if not ObjectId.is_valid(item_id):
+            return None
+        
+        related = RelatedService._index.related(item_id, limit)
+        if related is not None:
+            return related
+        
+        # Not indexed yet (e.g. created through another replica)
+        db = get_database()
+        item = await db.content_items.find_one({"_id": ObjectId(item_id)}, {"tags": 1, "category_id": 1})
+        if item is None:
+            return None
+        similar = RelatedService._index.similar(item.get("tags") or [], item.get("category_id"), limit + 1)
+        return [other for other in similar if other != item_id][:limit]
@@ -0,0 +1,100 @@
+from typing import Iterable, List, Optional, Tuple
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import get_database
+from app.core.index_refresher import IndexRefresher
+from app.core.tag_index import TagIndex
+
+
+class TagService:
+    """Service layer for tag lookups"""
+    
+    # Built in the background at startup and rebuilt every
+    # tag_index_ttl_seconds, or sooner after a write whose previous tags are
+    # unknown. In between, writes on this replica and inserts through other
+    # replicas (from the change stream) adjust the counts incrementally.
+    _index = TagIndex()
+    # Tag changes made while a rebuild is aggregating, replayed onto the new
+    # index before it is swapped in (a write the aggregation already saw is
+    # then counted twice until the next rebuild)
+    _pending: Optional[List[Tuple[Iterable[str], Iterable[str]]]] = None
+    # Items whose write this replica already applied, so the change event
+    # it causes is skipped instead of counted again
+    _applied = TTLCache(ttl=60.0, maxsize=10000)
+    
+    @staticmethod
+    async def _rebuild() -> None:
+        TagService._pending = []
+        try:
+            db = get_database()
+            cursor = db.content_items.aggregate([
+                {"$unwind": "$tags"},
+                {"$group": {"_id": "$tags", "count": {"$sum": 1}}}
+            ])
+            index = TagIndex()
+            index.load([(doc["_id"], doc["count"]) async for doc in cursor])
+            for added, removed in TagService._pending:
+                index.add(added)
+                index.remove(removed)
+            # Swap in the new index, so lookups never see a half-built one
+            TagService._index = index
+        finally:
+            TagService._pending = None
+    
+    refresher = IndexRefresher(
+        "tag",
+        lambda: TagService._rebuild(),
+        ttl=settings.tag_index_ttl_seconds,
+        min_interval=settings.tag_index_min_rebuild_seconds
+    )
+    
+    @staticmethod
+    def _apply(added: Iterable[str], removed: Iterable[str]) -> None:
+        added, removed = list(added), list(removed)
+        if TagService._pending is not None:
+            TagService._pending.append((added, removed))
+        if TagService.refresher.ready:
+            TagService._index.add(added)
+            TagService._index.remove(removed)
+    
+    @staticmethod
+    def record_change(item_id, added: Iterable[str] = (), removed: Iterable[str] = ()) -> None:
+        """Apply the tag changes of a content write made through this replica"""
+        TagService._applied.set(str(item_id), True)
+        TagService._apply(added, removed)
+    
+    @staticmethod
+    def apply_change(event: Optional[dict]) -> None:
+        """Apply a content_items change stream event, or rebuild when
+        events may have been missed (``event`` is None)"""
+        if event is None:
+            TagService.refresher.mark_stale()
+            return
+        
+        item_id = str(event["documentKey"]["_id"])
+        if TagService._applied.get(item_id) is not None:
+            TagService._applied.delete(item_id)
+            return
+        
+        operation = event["operationType"]
+        if operation == "insert":
+            TagService._apply((event.get("fullDocument") or {}).get("tags") or [], ())
+        elif operation == "update":
+            changed = (event.get("updatedFields") or []) + (event.get("removedFields") or [])
+            if any(name.split(".")[0] == "tags" for name in changed):
+                TagService.mark_stale()
+        else:
+            # Replaced or deleted elsewhere; the previous tags are unknown
+            TagService.mark_stale()
+    
+    @staticmethod
+    def mark_stale() -> None:
+        """Rebuild the index in the background, e.g. after a write whose
+        previous tags are unknown"""
+        TagService.refresher.mark_stale()
+    
+    @staticmethod
+    async def suggest(prefix: str, limit: int = 10) -> List[dict]:
+        """Get tags starting with ``prefix``, most used first. Empty until
+        the first build completes."""
+        return [{"tag": tag, "count": count} for tag, count in TagService._index.suggest(prefix, limit)]
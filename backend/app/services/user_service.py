@@ -1,6 +1,9 @@
 from typing import Optional
+from pymongo.errors import DuplicateKeyError
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.core.database import get_database
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash_async, verify_password_async
 from app.schemas.user_schema import UserCreateSchema
 from datetime import datetime
 
@@ -8,18 +11,29 @@ from datetime import datetime
 class UserService:
     """Service layer for user operations"""
     
+    # Authenticated user lookups keyed by email, without the password hash
+    _user_cache = TTLCache(ttl=settings.user_cache_ttl_seconds, maxsize=settings.user_cache_max_entries)
+    
+    @staticmethod
+    def invalidate_user(email: Optional[str] = None) -> None:
+        """Drop a cached user, or every cached user when no email is given"""
+        if email is None:
+            UserService._user_cache.clear()
+        else:
+            UserService._user_cache.delete(email)
+    
+    @staticmethod
+    def cache_stats() -> dict:
+        """Get user cache hit/miss counters"""
+        return UserService._user_cache.stats()
+    
     @staticmethod
     async def create_user(user: UserCreateSchema) -> Optional[dict]:
         """Create a new user"""
         db = get_database()
         
-        # Check if user already exists
-        existing_user = await db.users.find_one({"email": user.email})
-        if existing_user:
-            return None
-        
         # Create new user
-        hashed_password = get_password_hash(user.password)
+        hashed_password = await get_password_hash_async(user.password)
         user_dict = {
             "email": user.email,
             "hashed_password": hashed_password,
@@ -28,11 +42,16 @@ class UserService:
             "created_at": datetime.utcnow()
         }
         
-        result = await db.users.insert_one(user_dict)
-        created_user = await db.users.find_one({"_id": result.inserted_id})
-        created_user["_id"] = str(created_user["_id"])
+        # The unique email index rejects duplicates atomically
+        try:
+            await db.users.insert_one(user_dict)
+        except DuplicateKeyError:
+            return None
+        
+        UserService.invalidate_user(user.email)
+        user_dict["_id"] = str(user_dict["_id"])
         
-        return created_user
+        return user_dict
     
     @staticmethod
     async def authenticate_user(email: str, password: str) -> Optional[dict]:
@@ -43,7 +62,7 @@ class UserService:
         if not user:
             return None
         
-        if not verify_password(password, user["hashed_password"]):
+        if not await verify_password_async(password, user["hashed_password"]):
             return None
         
         user["_id"] = str(user["_id"])
@@ -59,3 +78,23 @@ class UserService:
             user["_id"] = str(user["_id"])
         
         return user
+    
+    @staticmethod
+    async def get_active_user_by_email(email: str) -> Optional[dict]:
+        """Get a user by email for request authentication, served from cache.
+        
+        Only active users are returned, so deactivated accounts cannot
+        authenticate. The password hash is never fetched, so the returned
+        document is safe to hand to route handlers.
+        """
+        cached = UserService._user_cache.get(email)
+        if cached is not None:
+            return dict(cached)
+        
+        db = get_database()
+        user = await db.users.find_one({"email": email, "is_active": True}, {"hashed_password": 0})
+        if user:
+            user["_id"] = str(user["_id"])
+            UserService._user_cache.set(email, dict(user))
+        
+        return user
@@ -0,0 +1,147 @@
+import asyncio
+import logging
+import math
+from datetime import datetime
+from typing import Dict, Optional, Set
+from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import PyMongoError
+from app.core.config import settings
+from app.core.database import get_database
+
+logger = logging.getLogger(__name__)
+
+# Trending scores are stored relative to this fixed instant (see _score_increment)
+TRENDING_EPOCH = datetime(2024, 1, 1)
+
+
+def _score_increment(views: int, at: datetime) -> float:
+    """Log-space trending weight of ``views`` views seen at ``at``.
+    
+    A view's weight decays by half every ``trending_half_life_hours``. Rather
+    than decaying every stored score over time, new views are weighted up by
+    the same factor relative to ``TRENDING_EPOCH``, which orders items the same
+    way. Scores are kept as logarithms so they never overflow.
+    """
+    decay_seconds = settings.trending_half_life_hours * 3600 / math.log(2)
+    return math.log(views) + (at - TRENDING_EPOCH).total_seconds() / decay_seconds
+
+
+def _view_update(views: int, at: datetime) -> list:
+    """Pipeline update adding views and folding them into the trending score.
+    
+    The new score is log(exp(old) + exp(increment)), computed as
+    max + log(1 + exp(min - max)) to stay within floating point range.
+    """
+    increment = _score_increment(views, at)
+    return [{"$set": {
+        "views": {"$add": [{"$ifNull": ["$views", 0]}, views]},
+        "trending_score": {"$let": {
+            "vars": {
+                "high": {"$max": [{"$ifNull": ["$trending_score", increment]}, increment]},
+                "low": {"$min": [{"$ifNull": ["$trending_score", float("-inf")]}, increment]}
+            },
+            "in": {"$add": ["$$high", {"$ln": {"$add": [1, {"$exp": {"$subtract": ["$$low", "$$high"]}}]}}]}
+        }}
+    }}]
+
+
+class ViewCounter:
+    """Per-worker buffer of content view counts, written in batches.
+    
+    Views are accumulated in memory and flushed every
+    ``view_flush_interval_seconds`` with one unordered ``bulk_write``, or as
+    soon as ``view_buffer_max_items`` distinct items are buffered. Counts that
+    cannot be buffered or written while the database is struggling are
+    dropped and counted, so memory stays bounded.
+    """
+    
+    # Flushes allowed in flight before further views are dropped
+    MAX_PENDING_FLUSHES = 2
+    
+    def __init__(self):
+        self.recorded = 0
+        self.flushed = 0
+        self.dropped = 0
+        self._counts: Dict[str, int] = {}
+        self._pending: Set[asyncio.Task] = set()
+        self._task: Optional[asyncio.Task] = None
+    
+    def record(self, item_id: str) -> None:
+        """Count one view of a content item"""
+        if not ObjectId.is_valid(item_id):
+            return
+        if item_id not in self._counts and len(self._counts) >= settings.view_buffer_max_items:
+            if len(self._pending) >= self.MAX_PENDING_FLUSHES:
+                self.dropped += 1
+                return
+            # Hand the full buffer to a background write and start a new one
+            task = asyncio.create_task(self._write(self._swap()))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+        
+        self._counts[item_id] = self._counts.get(item_id, 0) + 1
+        self.recorded += 1
+    
+    def _swap(self) -> Dict[str, int]:
+        counts, self._counts = self._counts, {}
+        return counts
+    
+    async def _write(self, counts: Dict[str, int]) -> None:
+        if not counts:
+            return
+        
+        now = datetime.utcnow()
+        operations = [
+            UpdateOne({"_id": ObjectId(item_id)}, _view_update(views, now))
+            for item_id, views in counts.items()
+        ]
+        try:
+            await get_database().content_items.bulk_write(operations, ordered=False)
+            self.flushed += sum(counts.values())
+        except PyMongoError as e:
+            self.dropped += sum(counts.values())
+            logger.warning("Dropped %d buffered views: %s", sum(counts.values()), e)
+    
+    async def flush(self) -> None:
+        """Write buffered views now and wait for writes already in flight"""
+        await self._write(self._swap())
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+    
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(settings.view_flush_interval_seconds)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("View counter flush failed")
+    
+    async def start(self) -> None:
+        """Start flushing periodically in the background"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Stop the periodic flush and drain the buffer"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+    
+    def stats(self) -> dict:
+        """Buffer size and view counters"""
+        return {
+            "buffered_items": len(self._counts),
+            "pending_flushes": len(self._pending),
+            "recorded": self.recorded,
+            "flushed": self.flushed,
+            "dropped": self.dropped
+        }
+
+
+view_counter = ViewCounter()
@@ -0,0 +1,84 @@
+"""Synthetic dataset for benchmarks.
+
+Seeds a dedicated database with categories, authors, content items and a
+benchmark user, deterministically for a given seed and size so results are
+comparable between commits.
+"""
+import random
+from datetime import datetime, timedelta
+from typing import List
+
+from app.core.indexes import ensure_indexes
+from app.core.security import get_password_hash
+
+BENCH_EMAIL = "bench-user@example.com"
+BENCH_PASSWORD = "benchmark-password"
+
+WORDS = [
+    "mundane", "design", "culture", "network", "philosophy", "ritual", "signal",
+    "archive", "memory", "silence", "practice", "craft", "city", "language",
+    "attention", "garden", "machine", "ordinary", "tension", "threshold", "ecology",
+    "pattern", "rhythm", "distance", "surface", "weather", "river", "habit"
+]
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+async def seed_dataset(db, items: int, seed: int = 42, batch_size: int = 5000) -> dict:
+    """Drop and repopulate the benchmark collections.
+    
+    Returns the IDs the scenarios sample from.
+    """
+    rng = random.Random(seed)
+    for name in ("categories", "authors", "content_items", "users", "collection_versions"):
+        await db[name].drop()
+    
+    categories = [
+        {"name": word.title(), "slug": word, "description": _sentence(rng, 8)}
+        for word in WORDS[:10]
+    ]
+    await db.categories.insert_many(categories)
+    category_ids = [str(cat["_id"]) for cat in categories]
+    
+    authors = [
+        {"name": f"Author {i}", "bio": _sentence(rng, 12), "avatar_url": f"https://example.com/avatars/{i}.svg"}
+        for i in range(50)
+    ]
+    await db.authors.insert_many(authors)
+    author_ids = [str(author["_id"]) for author in authors]
+    
+    started = datetime.utcnow().replace(microsecond=0)
+    content_ids: List[str] = []
+    for offset in range(0, items, batch_size):
+        batch = []
+        for i in range(offset, min(items, offset + batch_size)):
+            batch.append({
+                "title": _sentence(rng, 4).title(),
+                "description": _sentence(rng, 40),
+                "category_id": rng.choice(category_ids),
+                "author_id": rng.choice(author_ids),
+                "image_url": f"https://example.com/images/{i}.jpg",
+                "tags": rng.sample(WORDS, 3),
+                "created_at": started - timedelta(seconds=i)
+            })
+        await db.content_items.insert_many(batch, ordered=False)
+        content_ids.extend(str(doc["_id"]) for doc in batch)
+    
+    await db.users.insert_one({
+        "email": BENCH_EMAIL,
+        "hashed_password": get_password_hash(BENCH_PASSWORD),
+        "full_name": "Benchmark User",
+        "is_active": True,
+        "created_at": started
+    })
+    
+    # The same indexes the app ensures at startup, built once over the loaded data
+    await ensure_indexes(db)
+    
+    return {
+        "category_ids": category_ids,
+        "author_ids": author_ids,
+        "content_ids": content_ids
+    }
@@ -0,0 +1,108 @@
+"""Login storm benchmark.
+
+Fires a burst of concurrent logins at the in-process ASGI app while a probe
+loop issues unrelated GETs, and reports login throughput plus probe latency
+percentiles. Compare against inline hashing to see the event-loop stall:
+    
+    cd backend
+    python -m benchmarks.login_storm --logins 200
+    PASSWORD_HASH_WORKERS=0 python -m benchmarks.login_storm --logins 200
+
+Requires a reachable MongoDB (MONGODB_URL / MONGODB_DB_NAME).
+"""
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from typing import List
+
+import httpx
+
+from app.core.config import settings
+from app.core.database import close_mongo_connection, connect_to_mongo
+from app.main import app
+from benchmarks.stats import percentile
+
+
+async def probe(client: httpx.AsyncClient, stop: asyncio.Event, latencies: List[float], path: str):
+    """Issue GETs back to back until stopped, recording latency in ms"""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.get(path)
+        latencies.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(0.005)
+
+
+async def run(logins: int, concurrency: int, probe_path: str) -> dict:
+    await connect_to_mongo()
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            email = f"bench-{uuid.uuid4().hex[:12]}@example.com"
+            credentials = {"email": email, "password": "benchmark-password"}
+            response = await client.post(
+                f"{settings.api_v1_prefix}/auth/register",
+                json={**credentials, "full_name": "Benchmark User"}
+            )
+            response.raise_for_status()
+            
+            # Baseline probe latency with no logins in flight
+            idle: List[float] = []
+            stop = asyncio.Event()
+            idle_task = asyncio.create_task(probe(client, stop, idle, probe_path))
+            await asyncio.sleep(1.0)
+            stop.set()
+            await idle_task
+            
+            storm: List[float] = []
+            stop = asyncio.Event()
+            probe_task = asyncio.create_task(probe(client, stop, storm, probe_path))
+            slots = asyncio.Semaphore(concurrency)
+            
+            async def login():
+                async with slots:
+                    result = await client.post(f"{settings.api_v1_prefix}/auth/login", json=credentials)
+                    result.raise_for_status()
+            
+            started = time.perf_counter()
+            await asyncio.gather(*(login() for _ in range(logins)))
+            elapsed = time.perf_counter() - started
+            stop.set()
+            await probe_task
+    finally:
+        await close_mongo_connection()
+    
+    return {
+        "password_hash_workers": settings.password_hash_workers,
+        "logins": logins,
+        "concurrency": concurrency,
+        "login_seconds": round(elapsed, 3),
+        "logins_per_second": round(logins / elapsed, 2),
+        "probe_path": probe_path,
+        "probe_idle_ms": {
+            "p50": round(percentile(idle, 50), 2),
+            "p99": round(percentile(idle, 99), 2)
+        },
+        "probe_during_storm_ms": {
+            "samples": len(storm),
+            "p50": round(percentile(storm, 50), 2),
+            "p95": round(percentile(storm, 95), 2),
+            "p99": round(percentile(storm, 99), 2)
+        }
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure GET latency during a login storm")
+    parser.add_argument("--logins", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--probe-path", default="/api/health")
+    args = parser.parse_args()
+    
+    result = asyncio.run(run(args.logins, args.concurrency, args.probe_path))
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
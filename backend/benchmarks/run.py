@@ -0,0 +1,183 @@
+"""API benchmark suite.
+
+Seeds a synthetic dataset into a dedicated database and drives scripted
+scenarios against the API, reporting throughput and latency percentiles as
+JSON. By default the ASGI app is called in-process; pass ``--url`` to go
+over a real socket to a running uvicorn serving the same database.
+    
+    cd backend
+    pip install -r benchmarks/requirements.txt
+    python -m benchmarks.run --items 50000 --output results.json
+    python -m benchmarks.run --items 50000 --baseline results.json
+
+With ``--baseline`` the run exits non-zero when any scenario's p95 latency
+regresses by more than ``--max-regression`` (default 20%).
+"""
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+from typing import Awaitable, Callable, Dict, List
+
+import httpx
+
+from app.core.config import settings
+from benchmarks.dataset import BENCH_EMAIL, BENCH_PASSWORD, WORDS, seed_dataset
+from benchmarks.stats import summarize
+
+API = settings.api_v1_prefix
+SCENARIOS = ["list", "list_deep", "list_category", "search", "get_by_id", "login", "create"]
+
+
+def make_scenarios(ids: dict, rng: random.Random) -> Dict[str, Callable[[httpx.AsyncClient], Awaitable[httpx.Response]]]:
+    """One request factory per scenario"""
+    credentials = {"email": BENCH_EMAIL, "password": BENCH_PASSWORD}
+    
+    async def list_deep(client):
+        # Walk five pages with the keyset cursor; the whole walk is timed as
+        # one sample, so compare it against about five times the list p95
+        response = await client.get(f"{API}/content", params={"limit": 50})
+        for _ in range(4):
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+            response = await client.get(f"{API}/content", params={"limit": 50, "cursor": cursor})
+        return response
+    
+    return {
+        "list": lambda client: client.get(f"{API}/content", params={"limit": 50}),
+        "list_deep": list_deep,
+        "list_category": lambda client: client.get(
+            f"{API}/content", params={"limit": 50, "category": rng.choice(ids["category_ids"])}
+        ),
+        "search": lambda client: client.get(f"{API}/content", params={"search": rng.choice(WORDS), "limit": 20}),
+        "get_by_id": lambda client: client.get(f"{API}/content/{rng.choice(ids['content_ids'])}"),
+        "login": lambda client: client.post(f"{API}/auth/login", json=credentials),
+        "create": lambda client: client.post(f"{API}/content", json={
+            "title": f"Benchmark item {rng.randrange(1_000_000)}",
+            "description": " ".join(rng.choice(WORDS) for _ in range(30)),
+            "category_id": rng.choice(ids["category_ids"]),
+            "author_id": rng.choice(ids["author_ids"]),
+            "tags": rng.sample(WORDS, 3)
+        }),
+    }
+
+
+async def run_scenario(client: httpx.AsyncClient, request, requests: int, concurrency: int, warmup: int) -> dict:
+    """Issue ``requests`` calls from ``concurrency`` workers"""
+    for _ in range(warmup):
+        await request(client)
+    
+    latencies: List[float] = []
+    errors = 0
+    remaining = requests
+    
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                response = await request(client)
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+    
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, time.perf_counter() - started, errors)
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def run(args) -> dict:
+    # Point the app at the benchmark database before it connects
+    settings.mongodb_db_name = args.db
+    from app.core import database
+    from app.main import app
+    
+    await database.connect_to_mongo()
+    try:
+        ids = await seed_dataset(database.get_database(), args.items, seed=args.seed)
+        if args.url:
+            client = httpx.AsyncClient(base_url=args.url, timeout=30)
+        else:
+            client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=30)
+        
+        rng = random.Random(args.seed)
+        scenarios = make_scenarios(ids, rng)
+        results = {}
+        async with client:
+            for name in args.scenarios:
+                requests = args.login_requests if name == "login" else args.requests
+                results[name] = await run_scenario(client, scenarios[name], requests, args.concurrency, args.warmup)
+                print(f"{name:>14}: {json.dumps(results[name])}", file=sys.stderr)
+    finally:
+        await database.close_mongo_connection()
+    
+    return {
+        "commit": git_commit(),
+        "transport": args.url or "asgi",
+        "items": args.items,
+        "concurrency": args.concurrency,
+        "scenarios": results
+    }
+
+
+def compare(report: dict, baseline: dict, max_regression: float) -> List[str]:
+    """Scenarios whose p95 regressed beyond the allowed ratio"""
+    regressions = []
+    for name, result in report["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if not previous or not previous["p95_ms"]:
+            continue
+        ratio = result["p95_ms"] / previous["p95_ms"] - 1
+        if ratio > max_regression:
+            regressions.append(f"{name}: p95 {previous['p95_ms']}ms -> {result['p95_ms']}ms (+{ratio:.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Educated Guess API")
+    parser.add_argument("--db", default="educated_guess_bench", help="Database to seed (dropped first)")
+    parser.add_argument("--items", type=int, default=10000, help="Synthetic content items to seed")
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per scenario")
+    parser.add_argument("--login-requests", type=int, default=100, help="Requests for the login scenario")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--url", help="Benchmark a running server instead of the in-process app")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--baseline", help="Previous JSON report to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.2)
+    args = parser.parse_args()
+    
+    report = asyncio.run(run(args))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    print(output)
+    
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.max_regression)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
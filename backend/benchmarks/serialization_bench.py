@@ -0,0 +1,92 @@
+"""Content list serialization micro-benchmark.
+
+Compares the CPU time needed to turn one page of content documents into a
+response body on the default FastAPI path (validate through
+``List[ContentSchema]``, dump, ``json.dumps``) against the fast path used by
+``GET /content`` (``shape_content`` + ``orjson``). No database is needed:
+    
+    cd backend
+    python -m benchmarks.serialization_bench --items 100 --iterations 2000
+"""
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+import orjson
+from bson import ObjectId
+from pydantic import TypeAdapter
+
+from app.schemas.content_schema import ContentSchema
+from app.services.content_service import shape_content
+
+
+def make_documents(count: int) -> List[dict]:
+    """Build raw documents shaped like content_items rows"""
+    now = datetime.utcnow().replace(microsecond=0)
+    return [
+        {
+            "_id": ObjectId(),
+            "title": f"Content item {i}",
+            "description": "Exploring the beauty and depth found in everyday moments " * 4,
+            "category_id": str(ObjectId()),
+            "author_id": str(ObjectId()),
+            "image_url": f"https://example.com/images/{i}.jpg",
+            "tags": ["philosophy", "mindfulness", "culture"],
+            "created_at": now - timedelta(minutes=i)
+        }
+        for i in range(count)
+    ]
+
+
+def pydantic_path(adapter: TypeAdapter, documents: List[dict]) -> bytes:
+    """What FastAPI does for a List[ContentSchema] response_model"""
+    items = []
+    for doc in documents:
+        item = dict(doc)
+        item["_id"] = str(item["_id"])
+        items.append(item)
+    validated = adapter.validate_python(items)
+    content = adapter.dump_python(validated, mode="json", by_alias=True)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def fast_path(documents: List[dict]) -> bytes:
+    """What GET /content does now"""
+    return orjson.dumps([shape_content(doc) for doc in documents])
+
+
+def measure(func, iterations: int) -> float:
+    """CPU microseconds per call"""
+    started = time.process_time()
+    for _ in range(iterations):
+        func()
+    return (time.process_time() - started) / iterations * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare content list serialization paths")
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=1000)
+    args = parser.parse_args()
+    
+    documents = make_documents(args.items)
+    adapter = TypeAdapter(List[ContentSchema])
+    
+    # Both paths must produce the same JSON document
+    assert json.loads(pydantic_path(adapter, documents)) == json.loads(fast_path(documents))
+    
+    baseline = measure(lambda: pydantic_path(adapter, documents), args.iterations)
+    optimized = measure(lambda: fast_path(documents), args.iterations)
+    print(json.dumps({
+        "items": args.items,
+        "iterations": args.iterations,
+        "pydantic_cpu_us_per_request": round(baseline, 1),
+        "orjson_cpu_us_per_request": round(optimized, 1),
+        "speedup": round(baseline / optimized, 2) if optimized else None
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+"""Unit tests. Run from backend/:
+    
+    pip install -r tests/requirements.txt
+    python -m pytest tests
+"""
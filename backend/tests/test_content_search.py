@@ -0,0 +1,82 @@
+import asyncio
+import re
+from datetime import datetime
+from bson import ObjectId
+from app.services import content_service
+from app.services.content_service import ContentService
+
+
+def _matches(doc: dict, query: dict) -> bool:
+    """Just enough of MongoDB's matching for the search queries"""
+    for key, condition in query.items():
+        if key == "$and":
+            if not all(_matches(doc, part) for part in condition):
+                return False
+        elif key == "$text":
+            # Whole words only, like the text index
+            words = set(re.findall(r"\w+", f"{doc['title']} {doc['description']}".lower()))
+            if not set(condition["$search"].lower().split()) & words:
+                return False
+        elif key == "title":
+            if not any(pattern.match(doc["title"]) for pattern in condition["$in"]):
+                return False
+        else:
+            raise AssertionError(f"Unexpected condition: {key}")
+    return True
+
+
+class _Cursor:
+    def __init__(self, docs):
+        self._docs = docs
+    
+    def sort(self, *args):
+        self._docs.sort(key=lambda doc: doc["created_at"], reverse=True)
+        return self
+    
+    def limit(self, count):
+        self._docs = self._docs[:count]
+        return self
+    
+    async def to_list(self, length):
+        return self._docs[:length]
+
+
+class _Collection:
+    def __init__(self, docs):
+        self._docs = docs
+    
+    def find(self, query, projection=None):
+        return _Cursor([dict(doc) for doc in self._docs if _matches(doc, query)])
+
+
+class _Database:
+    def __init__(self, docs):
+        self.content_items = _Collection(docs)
+
+
+def _item(title: str, day: int) -> dict:
+    return {
+        "_id": ObjectId(),
+        "title": title,
+        "description": "An essay",
+        "tags": [],
+        "created_at": datetime(2024, 1, day)
+    }
+
+
+def test_partial_word_search_matches_title_prefixes(monkeypatch):
+    docs = [_item("Design for Everyday Life", 1), _item("Designing Quiet Rooms", 2), _item("Slow Cities", 3)]
+    monkeypatch.setattr(content_service, "get_database", lambda: _Database(docs))
+    
+    results = asyncio.run(ContentService.search_content("desig"))
+    
+    assert [item["title"] for item in results] == ["Designing Quiet Rooms", "Design for Everyday Life"]
+
+
+def test_partial_last_word_search_keeps_whole_word_matches_first(monkeypatch):
+    docs = [_item("Slow Cities", 1), _item("Designing Quiet Rooms", 2), _item("Quiet Mornings", 3)]
+    monkeypatch.setattr(content_service, "get_database", lambda: _Database(docs))
+    
+    results = asyncio.run(ContentService.search_content("slow desig"))
+    
+    assert [item["title"] for item in results] == ["Slow Cities", "Designing Quiet Rooms"]
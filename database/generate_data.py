@@ -0,0 +1,161 @@
+"""Generate synthetic categories, authors, content items and users for scale testing.
+
+Usage:
+    python generate_data.py --items 1000000 --output data.ndjson
+    python init_db.py --input data.ndjson
+    python init_db.py --generate 1000000      # generate and load in one go
+
+Output is deterministic for a given seed and streamed one document at a
+time, so millions of items can be produced in constant memory. Tag and
+category popularity follow a Zipf-like distribution and creation times
+lean towards the present, like a real publishing history. Every
+synthetic user shares the password given by --user-password.
+"""
+import argparse
+import json
+import random
+import sys
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Iterator, Tuple
+
+WORDS = [
+    "mundane", "design", "culture", "network", "philosophy", "ritual", "signal",
+    "archive", "memory", "silence", "practice", "craft", "city", "language",
+    "attention", "garden", "machine", "ordinary", "tension", "threshold", "ecology",
+    "pattern", "rhythm", "distance", "surface", "weather", "river", "habit",
+    "light", "kitchen", "border", "season", "market", "screen", "letter", "commute",
+    "forest", "window", "stranger", "harbor", "noise", "map"
+]
+
+TAGS = [
+    "mindfulness", "philosophy", "everyday", "design", "technology", "culture", "art",
+    "music", "cities", "nature", "science", "history", "food", "travel", "language",
+    "work", "community", "ethics", "future", "memory", "architecture", "film", "books",
+    "photography", "health", "education", "economics", "climate", "play", "craft",
+    "internet", "ritual", "home", "identity", "attention", "slowness", "systems", "care"
+]
+
+FIRST_NAMES = [
+    "Alex", "Taylor", "Jordan", "Sam", "Morgan", "Casey", "Riley", "Jamie", "Avery",
+    "Quinn", "Rowan", "Sasha", "Robin", "Kai", "Noor", "Ines", "Tomas", "Mei", "Arun", "Lena"
+]
+
+LAST_NAMES = [
+    "Morgan", "Rivers", "Chen", "Okafor", "Silva", "Novak", "Haddad", "Larsen", "Kim",
+    "Moreau", "Patel", "Rossi", "Nakamura", "Ibrahim", "Kowalski", "Santos", "Byrne", "Weber"
+]
+
+
+def _zipf_weights(count: int, exponent: float = 1.1):
+    """Cumulative Zipf-like weights, precomputed so each draw is a bisect"""
+    return list(accumulate(1 / (rank ** exponent) for rank in range(1, count + 1)))
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def generate(
+    items: int,
+    categories: int = 12,
+    authors: int = 1000,
+    users: int = 0,
+    seed: int = 42,
+    days: int = 3 * 365,
+    user_password: str = "password123"
+) -> Iterator[Tuple[str, dict]]:
+    """Yield (collection, document) pairs: categories, then authors, content
+    items and users"""
+    rng = random.Random(seed)
+    now = datetime.utcnow().replace(microsecond=0)
+    
+    slugs = []
+    for i in range(categories):
+        word = WORDS[i % len(WORDS)]
+        slug = word if i < len(WORDS) else f"{word}-{i}"
+        slugs.append(slug)
+        yield "categories", {
+            "name": slug.replace("-", " ").title(),
+            "slug": slug,
+            "description": _sentence(rng, 8).capitalize()
+        }
+    
+    names = []
+    for i in range(authors):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {i}"
+        names.append(name)
+        yield "authors", {
+            "name": name,
+            "bio": _sentence(rng, 12).capitalize(),
+            "avatar_url": f"https://api.dicebear.com/7.x/avataaars/svg?seed={i}"
+        }
+    
+    category_weights = _zipf_weights(len(slugs))
+    tag_weights = _zipf_weights(len(TAGS))
+    # A few prolific authors write most of the content
+    author_weights = _zipf_weights(len(names), 0.8)
+    for i in range(items):
+        tags = set(rng.choices(TAGS, cum_weights=tag_weights, k=rng.randint(1, 5)))
+        # Skew creation times towards the present
+        age = timedelta(seconds=int(days * 86400 * rng.random() ** 2))
+        yield "content_items", {
+            "key": f"synthetic-{seed}-{i}",
+            "title": _sentence(rng, rng.randint(3, 7)).title(),
+            "description": _sentence(rng, rng.randint(20, 60)).capitalize(),
+            "category": rng.choices(slugs, cum_weights=category_weights)[0] if slugs else None,
+            "author": rng.choices(names, cum_weights=author_weights)[0] if names else None,
+            "image_url": f"https://picsum.photos/seed/{seed}-{i}/800/600",
+            "tags": sorted(tags),
+            "created_at": now - age
+        }
+    
+    if users:
+        # Hashing is deliberately slow, so every user shares one hash
+        from passlib.context import CryptContext
+        hashed_password = CryptContext(schemes=["bcrypt"], deprecated="auto").hash(user_password)
+        for i in range(users):
+            yield "users", {
+                "email": f"user{i}@example.com",
+                "hashed_password": hashed_password,
+                "full_name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                "is_active": True,
+                "created_at": now - timedelta(seconds=rng.randint(0, days * 86400))
+            }
+
+
+def write_ndjson(records: Iterator[Tuple[str, dict]], out) -> int:
+    """Write records in the NDJSON layout init_db.py reads, returning the count"""
+    count = 0
+    for collection, doc in records:
+        doc = {"collection": collection, **doc}
+        out.write(json.dumps(doc, default=lambda value: value.isoformat()) + "\n")
+        count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic data as NDJSON")
+    parser.add_argument("--items", type=int, required=True, help="Content items to generate")
+    parser.add_argument("--categories", type=int, default=12)
+    parser.add_argument("--authors", type=int, default=1000)
+    parser.add_argument("--users", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--days", type=int, default=3 * 365, help="Spread creation times over this many days")
+    parser.add_argument("--user-password", default="password123", help="Password shared by synthetic users")
+    parser.add_argument("--output", default="-", help="Output file, or - for stdout")
+    args = parser.parse_args()
+    
+    records = generate(
+        args.items, args.categories, args.authors, args.users, args.seed, args.days, args.user_password
+    )
+    if args.output == "-":
+        count = write_ndjson(records, sys.stdout)
+    else:
+        with open(args.output, "w", encoding="utf-8") as out:
+            count = write_ndjson(records, out)
+    print(f"✓ Generated {count:,} documents", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
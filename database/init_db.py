@@ -1,95 +1,416 @@
+"""Load seed or synthetic data into MongoDB.
+
+Usage:
+    python init_db.py                                # reset and load seed_data.json
+    python init_db.py --mode upsert                  # load without dropping anything
+    python init_db.py --input items.ndjson           # stream a large NDJSON file
+    python init_db.py --generate 1000000 --users 10000
+
+Inputs are read incrementally and written in bounded, concurrent batches,
+so memory stays flat regardless of input size. JSON files use the
+seed_data.json layout; NDJSON files hold one document per line with a
+"collection" key naming its target collection. Content items reference
+their category by slug and their author by name.
+"""
+import argparse
 import asyncio
+import hashlib
 import json
-from motor.motor_asyncio import AsyncIOMotorClient
+import os
+import time
 from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, DESCENDING, IndexModel, UpdateOne
+from pymongo.errors import BulkWriteError
+
+COLLECTIONS = ["categories", "authors", "content_items", "users"]
+
+# Mirrors backend/app/core/indexes.py, which the app applies at startup;
+# kept here so this script runs without the backend package
+INDEXES = {
+    "categories": [IndexModel([("slug", ASCENDING)], unique=True)],
+    "authors": [IndexModel([("name", ASCENDING)])],
+    "content_items": [
+        IndexModel(
+            [("title", "text"), ("tags", "text"), ("description", "text")],
+            weights={"title": 10, "tags": 5, "description": 1},
+            name="content_text_search"
+        ),
+        IndexModel([("title", ASCENDING)]),
+        IndexModel([("category_id", ASCENDING)]),
+        IndexModel([("created_at", DESCENDING)]),
+        # Keyset pagination seeks on (created_at, _id), optionally within a category
+        IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([("category_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+        # Multikey index for exact tag filters, sorted newest first
+        IndexModel([("tags", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+        # Trending and most viewed feeds
+        IndexModel([("trending_score", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([("views", DESCENDING), ("_id", DESCENDING)]),
+    ],
+    "users": [IndexModel([("email", ASCENDING)], unique=True)],
+}
+
+
+class _JSONStream:
+    """Minimal incremental reader for the structural parts of a JSON file"""
+    
+    def __init__(self, f, chunk_size: int = 1 << 16):
+        self._f = f
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._decoder = json.JSONDecoder()
+    
+    def _fill(self) -> bool:
+        data = self._f.read(self._chunk_size)
+        if not data:
+            return False
+        self._buffer = self._buffer[self._pos:] + data
+        self._pos = 0
+        return True
+    
+    def peek(self) -> str:
+        """Next non-whitespace character, or "" at end of file"""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos].isspace():
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+    
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Malformed JSON input: expected {char!r}")
+        self._pos += 1
+    
+    def value(self):
+        """Decode the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+def iter_json_file(path: str) -> Iterator[Tuple[str, dict]]:
+    """Stream (collection, document) pairs from the arrays of a seed_data.json style file"""
+    with open(path, "r", encoding="utf-8") as f:
+        stream = _JSONStream(f)
+        stream.expect("{")
+        while stream.peek() != "}":
+            key = stream.value()
+            stream.expect(":")
+            if stream.peek() == "[":
+                stream.expect("[")
+                while stream.peek() != "]":
+                    yield key, stream.value()
+                    if stream.peek() == ",":
+                        stream.expect(",")
+                stream.expect("]")
+            else:
+                stream.value()
+            if stream.peek() == ",":
+                stream.expect(",")
+        stream.expect("}")
+
+
+def iter_ndjson_file(path: str) -> Iterator[Tuple[str, dict]]:
+    """Stream (collection, document) pairs from an NDJSON file"""
+    with open(path, "r", encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            doc = json.loads(line)
+            collection = doc.pop("collection", None)
+            if collection not in COLLECTIONS:
+                raise ValueError(f"Line {number}: unknown collection {collection!r}")
+            yield collection, doc
+
+
+def content_id(key: str) -> ObjectId:
+    """Deterministic _id for a content item, so reloading the same input
+    updates items instead of duplicating them"""
+    return ObjectId(hashlib.sha1(key.encode("utf-8")).digest()[:12])
+
+
+def _parse_datetime(value) -> Optional[datetime]:
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
+
+
+class SeedLoader:
+    """Write documents in bounded, concurrent batches.
+    
+    In ``reset`` mode documents are inserted; in ``upsert`` mode they are
+    matched on their natural key (category slug, author name, content key,
+    user email) so a load can be repeated without duplicating anything.
+    Categories and authors must come before the content items that reference
+    them, as they do in seed_data.json and generated data.
+    """
+    
+    def __init__(self, db, mode: str = "reset", batch_size: int = 1000, concurrency: int = 4):
+        self.db = db
+        self.mode = mode
+        self.batch_size = batch_size
+        self.category_ids: Dict[str, str] = {}
+        self.author_ids: Dict[str, str] = {}
+        self.written = {name: 0 for name in COLLECTIONS}
+        self.failed = {name: 0 for name in COLLECTIONS}
+        self.started = time.perf_counter()
+        self._buffers: Dict[str, List[dict]] = {name: [] for name in COLLECTIONS}
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._tasks: Dict[asyncio.Task, str] = {}
+        self._last_report = self.started
+        self._now = datetime.utcnow()
+    
+    async def add(self, collection: str, doc: dict) -> None:
+        """Queue one document, writing a batch once enough are buffered"""
+        if collection in ("content_items", "users"):
+            # References are resolved from the categories and authors written so far
+            await self._dispatch("categories")
+            await self._dispatch("authors")
+            await self._wait("categories", "authors")
+            doc = self._prepare_content(doc) if collection == "content_items" else self._prepare_user(doc)
+        
+        buffer = self._buffers[collection]
+        buffer.append(doc)
+        if len(buffer) >= self.batch_size:
+            await self._dispatch(collection)
+    
+    async def _wait(self, *collections: str) -> None:
+        tasks = [task for task, collection in self._tasks.items() if collection in collections]
+        if tasks:
+            await asyncio.gather(*tasks)
+    
+    def _prepare_content(self, item: dict) -> dict:
+        key = item.pop("key", None) or f"{item.get('title')}\x00{item.get('author')}"
+        doc = {
+            "_id": content_id(key),
+            "title": item["title"],
+            "description": item["description"],
+            "category_id": item.get("category_id") or self.category_ids.get(item.get("category")),
+            "author_id": item.get("author_id") or self.author_ids.get(item.get("author")),
+            "image_url": item.get("image_url"),
+            "tags": item.get("tags", []),
+            "created_at": _parse_datetime(item.get("created_at")) or self._now
+        }
+        return doc
+    
+    def _prepare_user(self, user: dict) -> dict:
+        user.setdefault("is_active", True)
+        user["created_at"] = _parse_datetime(user.get("created_at")) or self._now
+        return user
+    
+    async def _dispatch(self, collection: str) -> None:
+        batch, self._buffers[collection] = self._buffers[collection], []
+        if not batch:
+            return
+        # Bound the number of batches in flight, and so memory use
+        await self._semaphore.acquire()
+        task = asyncio.create_task(self._write(collection, batch))
+        self._tasks[task] = collection
+        task.add_done_callback(lambda done: self._tasks.pop(done, None))
+    
+    async def _write(self, collection: str, batch: List[dict]) -> None:
+        try:
+            if self.mode == "upsert":
+                await self._upsert(collection, batch)
+            else:
+                await self._insert(collection, batch)
+        finally:
+            self._semaphore.release()
+        self.report()
+    
+    async def _insert(self, collection: str, batch: List[dict]) -> None:
+        failed = set()
+        try:
+            await self.db[collection].insert_many(batch, ordered=False)
+        except BulkWriteError as e:
+            failed = {error["index"] for error in e.details.get("writeErrors", [])}
+        self.written[collection] += len(batch) - len(failed)
+        self.failed[collection] += len(failed)
+        
+        # insert_many assigns _ids in place, including to documents it failed
+        # to insert, so only map the ones that were written
+        inserted = (doc for position, doc in enumerate(batch) if position not in failed)
+        if collection == "categories":
+            self.category_ids.update((doc["slug"], str(doc["_id"])) for doc in inserted)
+        elif collection == "authors":
+            self.author_ids.update((doc["name"], str(doc["_id"])) for doc in inserted)
+    
+    async def _upsert(self, collection: str, batch: List[dict]) -> None:
+        if collection == "categories":
+            key = "slug"
+        elif collection == "authors":
+            key = "name"
+        elif collection == "users":
+            key = "email"
+        else:
+            key = "_id"
+        
+        operations = []
+        for doc in batch:
+            fields = {name: value for name, value in doc.items() if name not in (key, "created_at")}
+            if collection == "users":
+                # Never overwrite an existing user's password or profile
+                update = {"$setOnInsert": doc}
+            else:
+                update = {"$set": fields}
+                if "created_at" in doc:
+                    update["$setOnInsert"] = {"created_at": doc["created_at"]}
+            operations.append(UpdateOne({key: doc[key]}, update, upsert=True))
+        
+        errors = 0
+        try:
+            await self.db[collection].bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            errors = len(e.details.get("writeErrors", []))
+        self.written[collection] += len(batch) - errors
+        self.failed[collection] += errors
+        
+        if collection in ("categories", "authors"):
+            ids = self.category_ids if collection == "categories" else self.author_ids
+            cursor = self.db[collection].find({key: {"$in": [doc[key] for doc in batch]}}, {key: 1})
+            async for doc in cursor:
+                ids[doc[key]] = str(doc["_id"])
+    
+    def report(self, force: bool = False) -> None:
+        """Print overall throughput, at most every two seconds unless forced"""
+        now = time.perf_counter()
+        if not force and now - self._last_report < 2:
+            return
+        self._last_report = now
+        total = sum(self.written.values())
+        elapsed = max(now - self.started, 1e-9)
+        print(f"  … {total:,} documents written ({total / elapsed:,.0f} docs/s)")
+    
+    async def drain(self) -> None:
+        """Write everything buffered and wait for all batches to finish"""
+        for collection in COLLECTIONS:
+            await self._dispatch(collection)
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks))
 
 
-async def init_database():
+async def create_indexes(db) -> None:
+    """Create every index; existing identical indexes are left as they are,
+    and an outdated text index (at most one is allowed) is replaced"""
+    for collection, indexes in INDEXES.items():
+        wanted = next((m.document for m in indexes if "text" in m.document["key"].values()), None)
+        if wanted is not None:
+            for name, info in (await db[collection].index_information()).items():
+                if ("_fts", "text") in info["key"] and (
+                    name != wanted["name"] or info.get("weights") != wanted.get("weights")
+                ):
+                    print(f"  ✓ Replacing text index {name} on {collection}")
+                    await db[collection].drop_index(name)
+        await db[collection].create_indexes(indexes)
+
+
+async def init_database(
+    source: Iterator[Tuple[str, dict]],
+    mode: str = "reset",
+    batch_size: int = 1000,
+    concurrency: int = 4
+):
     """Initialize MongoDB database with schema and seed data"""
     
     # Configuration
     # You can set MONGODB_URL as environment variable for authenticated connections
     # Example: export MONGODB_URL="mongodb://app_user:YOUR_PASSWORD@VM_IP:27017/educated_guess?authSource=educated_guess"
-    import os
     MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
-    DB_NAME = "educated_guess"
+    DB_NAME = os.getenv("MONGODB_DB_NAME", "educated_guess")
     
     print(f"🔗 Connecting to MongoDB...")
     print(f"   URL: {MONGODB_URL.split('@')[-1] if '@' in MONGODB_URL else MONGODB_URL}")  # Hide credentials in logs
     
     # Connect to MongoDB
-    client = AsyncIOMotorClient(MONGODB_URL)
+    client = AsyncIOMotorClient(MONGODB_URL, maxPoolSize=max(10, concurrency * 2))
     db = client[DB_NAME]
     
-    # Load seed data
-    with open('seed_data.json', 'r') as f:
-        seed_data = json.load(f)
-    
-    # Create categories collection and insert data
-    print("\n📁 Setting up categories...")
-    await db.categories.drop()
-    categories = seed_data['categories']
-    category_result = await db.categories.insert_many(categories)
-    category_map = {cat['slug']: str(id) for cat, id in zip(categories, category_result.inserted_ids)}
-    print(f"  ✓ Inserted {len(categories)} categories")
-    
-    # Create index on slug
-    await db.categories.create_index("slug", unique=True)
-    print("  ✓ Created unique index on slug")
-    
-    # Create authors collection and insert data
-    print("\n👤 Setting up authors...")
-    await db.authors.drop()
-    authors = seed_data['authors']
-    author_result = await db.authors.insert_many(authors)
-    author_map = {author['name']: str(id) for author, id in zip(authors, author_result.inserted_ids)}
-    print(f"  ✓ Inserted {len(authors)} authors")
-    
-    # Create index on name
-    await db.authors.create_index("name")
-    print("  ✓ Created index on name")
-    
-    # Create content_items collection and insert data
-    print("\n📝 Setting up content items...")
-    await db.content_items.drop()
-    content_items = []
-    for item in seed_data['content_items']:
-        content_item = {
-            "title": item['title'],
-            "description": item['description'],
-            "category_id": category_map.get(item['category']),
-            "author_id": author_map.get(item['author']),
-            "image_url": item['image_url'],
-            "tags": item['tags'],
-            "created_at": datetime.utcnow()
-        }
-        content_items.append(content_item)
+    if mode == "reset":
+        print("\n🧹 Dropping existing collections...")
+        for collection in COLLECTIONS:
+            await db[collection].drop()
+    else:
+        # Upserts look documents up by their natural keys, so index first
+        print("\n🗂️  Ensuring indexes...")
+        await create_indexes(db)
     
-    await db.content_items.insert_many(content_items)
-    print(f"  ✓ Inserted {len(content_items)} content items")
+    print(f"\n📝 Loading data ({mode} mode, batches of {batch_size}, {concurrency} concurrent)...")
+    loader = SeedLoader(db, mode, batch_size, concurrency)
+    for collection, doc in source:
+        if collection in COLLECTIONS:
+            await loader.add(collection, doc)
+    await loader.drain()
+    loader.report(force=True)
     
-    # Create indexes
-    await db.content_items.create_index([("title", "text"), ("description", "text")])
-    await db.content_items.create_index("category_id")
-    await db.content_items.create_index([("created_at", -1)])
-    print("  ✓ Created indexes (text search, category, created_at)")
+    for collection in COLLECTIONS:
+        failed = f", {loader.failed[collection]:,} failed" if loader.failed[collection] else ""
+        print(f"  ✓ {collection}: {loader.written[collection]:,} written{failed}")
     
-    # Create users collection with index
-    print("\n👥 Setting up users collection...")
-    await db.users.drop()
-    await db.users.create_index("email", unique=True)
-    print("  ✓ Created unique index on email")
+    if mode == "reset":
+        # Building indexes once over the loaded data beats maintaining them per insert
+        print("\n🗂️  Creating indexes...")
+        index_started = time.perf_counter()
+        await create_indexes(db)
+        print(f"  ✓ Created indexes in {time.perf_counter() - index_started:.1f}s")
     
+    # Reset collection version counters so cached ETags are not reused
+    await db.collection_versions.drop()
+    
+    elapsed = time.perf_counter() - loader.started
+    total = sum(loader.written.values())
     print("\n✅ Database initialization complete!")
     print(f"\n📊 Summary:")
     print(f"  - {await db.categories.count_documents({})} categories")
     print(f"  - {await db.authors.count_documents({})} authors")
-    print(f"  - {await db.content_items.count_documents({})} content items")
-    print(f"  - Users collection ready")
+    print(f"  - {await db.content_items.estimated_document_count()} content items")
+    print(f"  - {await db.users.estimated_document_count()} users")
+    print(f"  - {total:,} documents in {elapsed:.1f}s ({total / max(elapsed, 1e-9):,.0f} docs/s)")
     
     # Close connection
     client.close()
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Load seed or synthetic data into MongoDB")
+    parser.add_argument("--input", default="seed_data.json", help="JSON (seed_data.json layout) or NDJSON file")
+    parser.add_argument("--mode", choices=["reset", "upsert"], default="reset",
+                        help="reset drops the collections first; upsert updates in place")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=4, help="Batches written in parallel")
+    parser.add_argument("--generate", type=int, metavar="ITEMS",
+                        help="Load this many synthetic content items instead of --input")
+    parser.add_argument("--categories", type=int, default=12, help="Synthetic categories")
+    parser.add_argument("--authors", type=int, default=1000, help="Synthetic authors")
+    parser.add_argument("--users", type=int, default=0, help="Synthetic users")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for synthetic data")
+    args = parser.parse_args()
+    
+    if args.generate is not None:
+        from generate_data import generate
+        source = generate(args.generate, args.categories, args.authors, args.users, args.seed)
+    elif args.input.endswith((".ndjson", ".jsonl")):
+        source = iter_ndjson_file(args.input)
+    else:
+        source = iter_json_file(args.input)
+    
+    asyncio.run(init_database(source, args.mode, args.batch_size, args.concurrency))
+
+
 if __name__ == "__main__":
-    asyncio.run(init_database())
+    main()